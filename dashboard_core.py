@@ -1,23 +1,45 @@
 #!/usr/bin/env python3
 
+import heapq
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import select
 import socket
+import struct
+import sys
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-import queue
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Generic, List, Mapping, Optional, Tuple, TypeVar
 from dataclasses import dataclass, field
 
+from udp_batch import BatchReceiver, MAX_DATAGRAM_SIZE, is_frame, unpack_frame
+
+logger = logging.getLogger(__name__)
+
+json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    # orjson parses UTF-8 bytes directly, so the receive path never builds a str
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) store fields in C slots instead of a __dict__
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class RobotData:
     """Data structure for robot information"""
     robot_id: int = -1
     robot_name: str = ""
     team_id: int = -1
     timestamp: float = 0.0
-    last_update: datetime = field(default_factory=datetime.now)
+    last_update: float = field(default_factory=time.monotonic)  # time.monotonic() seconds
     
     # Game state
     game_state: str = "UNKNOWN"
@@ -65,29 +87,300 @@ class RobotData:
     is_connected: bool = False
 
 
+# Packet fields copied onto RobotData, grouped by their parent section:
+# (section path, ((packet key, RobotData attribute, default), ...)).
+# The timestamp is not listed: it is stored only after these copied cleanly.
+ROBOT_DATA_SCHEMA = (
+    ((), (
+        ('team_id', 'team_id', -1),
+        ('team_count', 'team_count', 0),
+    )),
+    (('game',), (
+        ('state', 'game_state', 'UNKNOWN'),
+        ('kickoff_side', 'kickoff_side', False),
+        ('score', 'score', 0),
+    )),
+    (('robot', 'pose'), (
+        ('x', 'pose_x', 0.0),
+        ('y', 'pose_y', 0.0),
+        ('theta', 'pose_theta', 0.0),
+    )),
+    (('robot', 'ball'), (
+        ('detected', 'ball_detected', False),
+        ('x', 'ball_x', 0.0),
+        ('y', 'ball_y', 0.0),
+        ('range', 'ball_range', 0.0),
+    )),
+    (('collaboration',), (
+        ('role', 'role', 'unknown'),
+        ('dynamic_role', 'dynamic_role', -1),
+        ('has_possession', 'has_possession', False),
+        ('possession_player', 'possession_player', -1),
+        ('ball_cost', 'ball_cost', 0.0),
+    )),
+    (('behavior',), (
+        ('decision', 'decision', 'unknown'),
+        ('ball_location_known', 'ball_location_known', False),
+    )),
+    (('performance',), (
+        ('avg_loop_time', 'avg_loop_time', 0.0),
+        ('max_loop_time', 'max_loop_time', 0.0),
+    )),
+    (('head',), (
+        ('pitch', 'head_pitch', 0.0),
+        ('yaw', 'head_yaw', 0.0),
+    )),
+    (('recovery',), (
+        ('state', 'recovery_state', 0),
+        ('available', 'recovery_available', False),
+    )),
+)
+
+
+def copy_schema_fields(data: Dict[str, Any], robot: RobotData) -> None:
+    """Copy every ROBOT_DATA_SCHEMA field from a packet, defaulting missing ones"""
+    for path, fields in ROBOT_DATA_SCHEMA:
+        section = data
+        for part in path:
+            section = section.get(part, {})
+        for key, attr, default in fields:
+            setattr(robot, attr, section.get(key, default))
+
+
+def compile_robot_parser(sample: Dict[str, Any]) -> Callable[[Dict[str, Any], RobotData], None]:
+    """Generate a field-copy function specialised to the layout of a sample packet
+    
+    Fields present in the sample are read by direct indexing; only fields the
+    sample lacks fall back to dict.get() with their default. The generated source
+    is built from ROBOT_DATA_SCHEMA alone, never from packet contents, so a
+    packet that deviates from the sample raises KeyError/TypeError and should be
+    handled with copy_schema_fields() instead.
+    """
+    lines = ["def parse(d, r):"]
+    for path, fields in ROBOT_DATA_SCHEMA:
+        section: Any = sample
+        expr = "d"
+        for part in path:
+            if isinstance(section, dict) and part in section:
+                section = section[part]
+                expr = f"{expr}[{part!r}]"
+            else:
+                section = {}
+                expr = f"{expr}.get({part!r}, {{}})"
+        lines.append(f"    s = {expr}")
+        for key, attr, default in fields:
+            if isinstance(section, dict) and key in section:
+                lines.append(f"    r.{attr} = s[{key!r}]")
+            else:
+                lines.append(f"    r.{attr} = s.get({key!r}, {default!r})")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace['parse']
+
+
+# Upper bound on generated field-copy functions. The cache key comes from the
+# packet, so senders beyond this many layouts use copy_schema_fields instead of
+# growing the cache (and running exec) without limit.
+MAX_PARSERS = 64
+
+# Compact alternative to the JSON packet: a fixed little-endian layout whose
+# leading tag byte tells it apart from JSON ('{') and from a frame (0x00).
+# String fields are sent as indices into the tables below.
+BINARY_PACKET_TAG = b'\x01'
+BINARY_PACKET = struct.Struct(
+    '<c'      # tag
+    'i32sid'  # robot_id, robot_name (UTF-8, NUL-padded), team_id, timestamp
+    'B?h'     # game: state, kickoff_side, score
+    'fff'     # robot.pose: x, y, theta
+    '?fff'    # robot.ball: detected, x, y, range
+    'Bi?if'   # collaboration: role, dynamic_role, has_possession, possession_player, ball_cost
+    'B?'      # behavior: decision, ball_location_known
+    'ff'      # performance: avg_loop_time, max_loop_time
+    'ff'      # head: pitch, yaw
+    'i?'      # recovery: state, available
+    'B'       # team_count
+)
+BINARY_GAME_STATES = ("INITIAL", "READY", "SET", "PLAY", "END")
+BINARY_ROLES = ("master", "slave", "striker", "goalkeeper", "follower")
+BINARY_DECISIONS = ("search_ball", "approach_ball", "kick_ball", "defend_goal", "position")
+
+
+def decode_binary_packet(data: bytes) -> Dict[str, Any]:
+    """Unpack a BINARY_PACKET into the same nested layout as a JSON packet
+    
+    Raises struct.error if the datagram does not have the packet's size.
+    """
+    (_, robot_id, name, team_id, timestamp,
+     state, kickoff_side, score,
+     pose_x, pose_y, pose_theta,
+     ball_detected, ball_x, ball_y, ball_range,
+     role, dynamic_role, has_possession, possession_player, ball_cost,
+     decision, ball_location_known,
+     avg_loop_time, max_loop_time,
+     head_pitch, head_yaw,
+     recovery_state, recovery_available,
+     team_count) = BINARY_PACKET.unpack(data)
+    return {
+        'robot_id': robot_id,
+        'robot_name': name.rstrip(b'\0').decode('utf-8', errors='replace'),
+        'team_id': team_id,
+        'timestamp': timestamp,
+        'game': {
+            'state': BINARY_GAME_STATES[state] if state < len(BINARY_GAME_STATES) else "UNKNOWN",
+            'kickoff_side': kickoff_side,
+            'score': score,
+        },
+        'robot': {
+            'pose': {'x': pose_x, 'y': pose_y, 'theta': pose_theta},
+            'ball': {'detected': ball_detected, 'x': ball_x, 'y': ball_y, 'range': ball_range},
+        },
+        'collaboration': {
+            'role': BINARY_ROLES[role] if role < len(BINARY_ROLES) else "unknown",
+            'dynamic_role': dynamic_role,
+            'has_possession': has_possession,
+            'possession_player': possession_player,
+            'ball_cost': ball_cost,
+        },
+        'behavior': {
+            'decision': BINARY_DECISIONS[decision] if decision < len(BINARY_DECISIONS) else "unknown",
+            'ball_location_known': ball_location_known,
+        },
+        'performance': {'avg_loop_time': avg_loop_time, 'max_loop_time': max_loop_time},
+        'head': {'pitch': head_pitch, 'yaw': head_yaw},
+        'recovery': {'state': recovery_state, 'available': recovery_available},
+        'team_count': team_count,
+    }
+
+
+# Disconnected robots are forgotten after this many seconds without data
+ROBOT_REMOVAL_SECONDS = 30.0
+
+T = TypeVar('T')
+
+
+class SpscRing(Generic[T]):
+    """Bounded single-producer/single-consumer ring buffer
+    
+    The producer only ever writes ``_head`` and the consumer only ever writes
+    ``_tail``. Each is a plain int store, atomic under the GIL, so no lock is
+    taken per item. Items put while the ring is full are dropped and counted.
+    """
+    
+    def __init__(self, capacity: int):
+        self._size = capacity + 1  # One slot stays empty to tell full from empty
+        self._buf: List[Optional[T]] = [None] * self._size
+        self._head = 0
+        self._tail = 0
+        self._ready = threading.Event()
+        self.dropped = 0
+        
+    def __len__(self) -> int:
+        return (self._head - self._tail) % self._size
+        
+    def put(self, item: T) -> bool:
+        """Producer: append an item, returning False if the ring was full"""
+        head = self._head
+        next_head = (head + 1) % self._size
+        if next_head == self._tail:
+            self.dropped += 1
+            return False
+        self._buf[head] = item
+        self._head = next_head
+        return True
+        
+    def notify(self) -> None:
+        """Producer: wake the consumer after one or more puts"""
+        self._ready.set()
+        
+    def get(self) -> Optional[T]:
+        """Consumer: pop the oldest item, or None if the ring is empty"""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        item = self._buf[tail]
+        self._buf[tail] = None
+        self._tail = (tail + 1) % self._size
+        return item
+        
+    def wait(self, timeout: float) -> None:
+        """Consumer: block until notified or the timeout passes, if still empty"""
+        # Clear before re-checking so a put + notify in between is never lost
+        self._ready.clear()
+        if self._tail == self._head:
+            self._ready.wait(timeout)
+
+
+# Minimum seconds between two invalid-packet reports
+INVALID_PACKET_LOG_INTERVAL = 1.0
+
+# Signature of functions registered with DashboardCore.add_update_callback
+UpdateCallback = Callable[[int, RobotData], None]
+
+# Signature of functions registered with DashboardCore.add_topology_callback
+TopologyCallback = Callable[[Mapping[int, RobotData]], None]
+
+
 class DashboardCore:
     """Core dashboard system for receiving and processing robot data"""
     
-    def __init__(self, port: int = 8080, timeout_seconds: int = 5):
+    def __init__(self, port: int = 8080, timeout_seconds: int = 5,
+                 recv_buffer_size: int = 4 * 1024 * 1024,
+                 queue_size: int = 1024,
+                 receive_cpu: Optional[int] = None, receive_nice: int = 0):
         self.port = port
         self.timeout_seconds = timeout_seconds
+        self.recv_buffer_size = recv_buffer_size
+        # Optional CPU pinning / niceness increment for the receive thread (Linux)
+        self.receive_cpu = receive_cpu
+        self.receive_nice = receive_nice
         self.robots: Dict[int, RobotData] = {}
-        self.data_queue = queue.Queue()
+        # Read-only view handed to readers; rebuilt only when robots join or leave
+        self._robots_snapshot: Mapping[int, RobotData] = MappingProxyType({})
+        self._snapshot_lock = threading.Lock()
+        # Min-heap of (deadline, robot_id) with one live entry per robot: its timeout
+        # while connected, its removal once disconnected. _scheduled holds the
+        # deadline of each live entry; heap entries that differ from it are stale.
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+        self._expiry_lock = threading.Lock()
+        # Deadline the cleanup thread sleeps until, and the event that wakes it
+        # early: set by stop() and when a robot's entry is due before that deadline
+        self._cleanup_deadline = float('inf')
+        self._cleanup_wake = threading.Event()
+        
+        # Field-copy functions generated per (team_id, firmware_version), at most MAX_PARSERS
+        self._parsers: Dict[Tuple[Any, Any], Callable[[Dict[str, Any], RobotData], None]] = {}
+        
+        # Raw datagrams handed from the receive thread to the parse worker.
+        # Bounded: when parsing falls behind, new packets are dropped.
+        self.data_queue: SpscRing[Tuple[bytes, Tuple[str, int]]] = SpscRing(queue_size)
         self.running = False
         
+        # Invalid packet log rate limiting
+        self._last_error_log = float('-inf')
+        self._suppressed_errors = 0
+        
         # Network
-        self.socket = None
-        self.receive_thread = None
-        self.cleanup_thread = None
+        self.socket: Optional[socket.socket] = None
+        self.receive_thread: Optional[threading.Thread] = None
+        self.parse_thread: Optional[threading.Thread] = None
+        self.cleanup_thread: Optional[threading.Thread] = None
         
-        # Callbacks for data updates
-        self.update_callbacks = []
+        # Callbacks for data updates and for robots connecting/disconnecting
+        self.update_callbacks: List[UpdateCallback] = []
+        self.topology_callbacks: List[TopologyCallback] = []
         
-    def add_update_callback(self, callback):
+    def add_update_callback(self, callback: UpdateCallback) -> None:
         """Add callback function that gets called when robot data is updated"""
         self.update_callbacks.append(callback)
         
-    def start(self):
+    def add_topology_callback(self, callback: TopologyCallback) -> None:
+        """Add callback function that gets called with get_robots() when a robot
+        connects, disconnects or is removed (not on ordinary data updates)"""
+        self.topology_callbacks.append(callback)
+        
+    def start(self) -> None:
         """Start the dashboard core receiver"""
         if self.running:
             return
@@ -96,28 +389,40 @@ class DashboardCore:
             # Create UDP socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # Large receive buffer absorbs multi-robot bursts while the receive
+            # thread is descheduled. Linux caps this at net.core.rmem_max.
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.recv_buffer_size)
             self.socket.bind(('', self.port))
-            self.socket.settimeout(1.0)  # 1 second timeout for clean shutdown
+            # Non-blocking: the receive thread waits in select() and drains batches
+            self.socket.setblocking(False)
             
             self.running = True
+            self._cleanup_wake.clear()
             
             # Start receiver thread
             self.receive_thread = threading.Thread(target=self._receive_data, daemon=True)
             self.receive_thread.start()
             
+            # Start parse worker (the only consumer of data_queue)
+            self.parse_thread = threading.Thread(target=self._parse_worker, daemon=True)
+            self.parse_thread.start()
+            
             # Start cleanup thread
             self.cleanup_thread = threading.Thread(target=self._cleanup_expired_robots, daemon=True)
             self.cleanup_thread.start()
             
-            print(f"Dashboard core started on port {self.port}")
+            logger.info("Dashboard core started on port %d", self.port)
             
         except Exception as e:
-            print(f"Failed to start dashboard core: {e}")
+            logger.error("Failed to start dashboard core: %s", e)
             self.stop()
             
-    def stop(self):
+    def stop(self) -> None:
         """Stop the dashboard core"""
         self.running = False
+        self._cleanup_wake.set()
         
         if self.socket:
             self.socket.close()
@@ -126,42 +431,163 @@ class DashboardCore:
         if self.receive_thread and self.receive_thread.is_alive():
             self.receive_thread.join(timeout=2.0)
             
+        # Wake the idle parse worker so it notices the shutdown
+        self.data_queue.notify()
+        if self.parse_thread and self.parse_thread.is_alive():
+            self.parse_thread.join(timeout=2.0)
+            
         if self.cleanup_thread and self.cleanup_thread.is_alive():
             self.cleanup_thread.join(timeout=2.0)
             
-        print("Dashboard core stopped")
+        logger.info("Dashboard core stopped")
         
-    def _receive_data(self):
+    def _receive_data(self) -> None:
         """Thread function to receive UDP data from robots"""
+        sock = self.socket
+        if sock is None:
+            return
+        self._tune_receive_thread()
+        # Buffers fit any UDP payload, so legitimate large packets are never cut short
+        receiver = BatchReceiver(sock, batch_size=32, buffer_size=MAX_DATAGRAM_SIZE)
+        batch_size = receiver.batch_size
+        truncated_seen = 0
+        
         while self.running:
             try:
-                data, addr = self.socket.recvfrom(4096)  # Max 4KB per message
-                
-                # Parse JSON data
-                try:
-                    raw_data = data.decode('utf-8')
-                    robot_data_json = json.loads(raw_data)
-                    self._process_robot_data(robot_data_json, addr)
-                except json.JSONDecodeError as e:
-                    print(f"Invalid JSON from {addr}: {e}")
-                    # Debug: Show the problematic JSON around the error location
-                    raw_data = data.decode('utf-8', errors='replace')
-                    error_pos = getattr(e, 'pos', 0)
-                    start = max(0, error_pos - 50)
-                    end = min(len(raw_data), error_pos + 50)
-                    print(f"JSON context around error: '{raw_data[start:end]}'")
-                    print(f"Full JSON (first 500 chars): '{raw_data[:500]}'")
-                except Exception as e:
-                    print(f"Error processing data from {addr}: {e}")
+                # 1 second timeout for clean shutdown
+                readable, _, _ = select.select([sock], [], [], 1.0)
+                if not readable:
+                    continue
+                    
+                # Only drain the socket here; parsing happens on the parse worker.
+                # A full batch means more datagrams are likely waiting, so keep
+                # reading without going back through select().
+                packets = receiver.recv_batch()
+                while packets:
+                    put = self.data_queue.put
+                    for packet in packets:
+                        put(packet)
+                    self.data_queue.notify()
+                    if len(packets) < batch_size:
+                        break
+                    packets = receiver.recv_batch()
+                    
+                if receiver.truncated != truncated_seen:
+                    logger.warning("Dropped %d truncated datagram(s) larger than %d bytes",
+                                   receiver.truncated - truncated_seen, receiver.buffer_size)
+                    truncated_seen = receiver.truncated
                     
-            except socket.timeout:
-                continue  # Normal timeout for clean shutdown
             except Exception as e:
                 if self.running:  # Only log if we're supposed to be running
-                    print(f"Socket error: {e}")
+                    logger.error("Socket error: %s", e)
                 break
                 
-    def _process_robot_data(self, data: Dict[str, Any], addr):
+    def _tune_receive_thread(self) -> None:
+        """Pin the calling (receive) thread to receive_cpu and apply receive_nice
+        
+        On Linux both calls affect only the calling thread. Negative niceness needs
+        CAP_SYS_NICE; without it the default priority is kept.
+        """
+        if self.receive_cpu is not None:
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {self.receive_cpu})
+                except OSError as e:
+                    logger.warning("Could not pin receive thread to CPU %d: %s", self.receive_cpu, e)
+            else:
+                logger.warning("CPU pinning is not supported on this platform")
+                
+        if self.receive_nice:
+            try:
+                os.nice(self.receive_nice)
+            except (OSError, AttributeError) as e:
+                logger.warning("Could not change receive thread priority: %s", e)
+                
+    def _parse_worker(self) -> None:
+        """Thread function to parse queued datagrams off the receive thread"""
+        data_queue = self.data_queue
+        
+        # Keep parsing off the receive thread's core so ingress never waits on it
+        if self.receive_cpu is not None and hasattr(os, 'sched_setaffinity'):
+            try:
+                other_cpus = os.sched_getaffinity(0) - {self.receive_cpu}
+                if other_cpus:
+                    os.sched_setaffinity(0, other_cpus)
+            except OSError as e:
+                logger.warning("Could not move parse worker off CPU %d: %s", self.receive_cpu, e)
+        
+        while self.running:
+            packet = data_queue.get()
+            if packet is None:
+                data_queue.wait(timeout=1.0)
+                continue
+            self._handle_datagram(*packet)
+            
+    def _handle_datagram(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Apply a datagram carrying one packet, or a frame of several, to the robot state"""
+        if not is_frame(data):
+            self._handle_packet(data, addr)
+            return
+        try:
+            packets = unpack_frame(data)
+        except ValueError as e:
+            if self._may_log_invalid_packet():
+                logger.warning("Malformed frame from %s: %s", addr, e)
+            return
+        for packet in packets:
+            self._handle_packet(packet, addr)
+            
+    def _handle_packet(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Parse a single robot packet (JSON or BINARY_PACKET) and apply it to the robot state"""
+        if data[:1] == BINARY_PACKET_TAG:
+            try:
+                packet = decode_binary_packet(data)
+            except struct.error as e:
+                if self._may_log_invalid_packet():
+                    logger.warning("Malformed binary packet from %s: %s", addr, e)
+                return
+            self._process_robot_data(packet, addr)
+            return
+            
+        # Parse JSON data straight from the packet bytes
+        try:
+            robot_data_json = json_loads(data)
+            self._process_robot_data(robot_data_json, addr)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            if not self._may_log_invalid_packet():
+                return
+                
+            logger.warning("Invalid JSON from %s: %s", addr, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Debug: Show the problematic JSON around the error location,
+                # decoding only the part that is logged
+                error_pos = getattr(e, 'pos', 0)
+                raw_data = data[:max(500, error_pos + 50)].decode('utf-8', errors='replace')
+                start = max(0, error_pos - 50)
+                end = min(len(raw_data), error_pos + 50)
+                logger.debug("JSON context around error: '%s'", raw_data[start:end])
+                logger.debug("Full JSON (first 500 chars): '%s'", raw_data[:500])
+        except Exception as e:
+            logger.error("Error processing data from %s: %s", addr, e)
+            
+    def _may_log_invalid_packet(self) -> bool:
+        """Return whether an invalid packet may be reported now, counting it otherwise
+        
+        Reports at most one bad packet per interval so a flood of garbage
+        datagrams cannot monopolise the parser with logging.
+        """
+        now = time.monotonic()
+        if now - self._last_error_log < INVALID_PACKET_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            return False
+        self._last_error_log = now
+        if self._suppressed_errors:
+            logger.warning("Suppressed %d further invalid packets", self._suppressed_errors)
+            self._suppressed_errors = 0
+        return True
+        
+    def _process_robot_data(self, data: Dict[str, Any], addr: Tuple[str, int]) -> None:
         """Process incoming robot data and update robot state"""
         try:
             robot_id = data.get('robot_id', -1)
@@ -169,130 +595,223 @@ class DashboardCore:
                 return
                 
             # Create or update robot data
-            if robot_id not in self.robots:
-                self.robots[robot_id] = RobotData()
-                
-            robot = self.robots[robot_id]
-            
-            # Update basic info
-            robot.robot_id = robot_id
-            robot.robot_name = data.get('robot_name', f"robot{robot_id}")
-            robot.team_id = data.get('team_id', -1)
-            robot.timestamp = data.get('timestamp', 0.0)
-            robot.last_update = datetime.now()
-            robot.is_connected = True
-            
-            # Update game state
-            game_data = data.get('game', {})
-            robot.game_state = game_data.get('state', 'UNKNOWN')
-            robot.kickoff_side = game_data.get('kickoff_side', False)
-            robot.score = game_data.get('score', 0)
-            
-            # Update robot pose
-            robot_data = data.get('robot', {})
-            pose_data = robot_data.get('pose', {})
-            robot.pose_x = pose_data.get('x', 0.0)
-            robot.pose_y = pose_data.get('y', 0.0)
-            robot.pose_theta = pose_data.get('theta', 0.0)
+            robot = self.robots.get(robot_id)
+            if robot is None:
+                robot = self.robots[robot_id] = RobotData()
+                self._publish_snapshot()
             
-            # Update ball information
-            ball_data = robot_data.get('ball', {})
-            robot.ball_detected = ball_data.get('detected', False)
-            robot.ball_x = ball_data.get('x', 0.0)
-            robot.ball_y = ball_data.get('y', 0.0)
-            robot.ball_range = ball_data.get('range', 0.0)
+            # Keep the robot alive. Only a (re)connecting robot needs a new heap
+            # entry; the cleanup thread moves a connected robot's entry on to
+            # last_update + timeout when it comes due. The flag is flipped under
+            # the lock so it cannot interleave with that timeout check.
+            now = time.monotonic()
+            with self._expiry_lock:
+                was_connected = robot.is_connected
+                robot.last_update = now
+                robot.is_connected = True
+                if not was_connected:
+                    deadline = now + self.timeout_seconds
+                    self._scheduled[robot_id] = deadline
+                    heapq.heappush(self._expiry_heap, (deadline, robot_id))
+                    if deadline < self._cleanup_deadline:
+                        self._cleanup_wake.set()
             
-            # Update collaboration
-            collab_data = data.get('collaboration', {})
-            robot.role = collab_data.get('role', 'unknown')
-            robot.dynamic_role = collab_data.get('dynamic_role', -1)
-            robot.has_possession = collab_data.get('has_possession', False)
-            robot.possession_player = collab_data.get('possession_player', -1)
-            robot.ball_cost = collab_data.get('ball_cost', 0.0)
+            # Robots bump their timestamp with every new sample; a repeat of the
+            # current one from a connected robot carries no new state
+            timestamp = data.get('timestamp', 0.0)
+            unchanged = bool(timestamp) and was_connected and timestamp == robot.timestamp
             
-            # Update behavior
-            behavior_data = data.get('behavior', {})
-            robot.decision = behavior_data.get('decision', 'unknown')
-            robot.ball_location_known = behavior_data.get('ball_location_known', False)
-            
-            # Update performance
-            perf_data = data.get('performance', {})
-            robot.avg_loop_time = perf_data.get('avg_loop_time', 0.0)
-            robot.max_loop_time = perf_data.get('max_loop_time', 0.0)
-            
-            # Update head tracking
-            head_data = data.get('head', {})
-            robot.head_pitch = head_data.get('pitch', 0.0)
-            robot.head_yaw = head_data.get('yaw', 0.0)
+            if unchanged:
+                # Skip field copying and callbacks for duplicate samples
+                return
             
-            # Update recovery state
-            recovery_data = data.get('recovery', {})
-            robot.recovery_state = recovery_data.get('state', 0)
-            robot.recovery_available = recovery_data.get('available', False)
+            # Update basic info
+            robot.robot_id = robot_id
+            robot.robot_name = data.get('robot_name', f"robot{robot_id}")
             
-            # Update team count
-            robot.team_count = data.get('team_count', 0)
+            # Copy the schema fields with the parser specialised for this sender
+            schema_key = (data.get('team_id', -1), data.get('firmware_version'))
+            try:
+                parser = self._parsers.get(schema_key)
+            except TypeError:
+                parser = copy_schema_fields  # Unhashable key values
+            if parser is None:
+                if len(self._parsers) < MAX_PARSERS:
+                    parser = self._parsers[schema_key] = compile_robot_parser(data)
+                else:
+                    parser = copy_schema_fields
+            try:
+                parser(data, robot)
+            except (KeyError, TypeError, AttributeError):
+                # Packet deviates from this sender's usual layout
+                copy_schema_fields(data, robot)
+            # Stored last: if a field had the wrong type (a TypeError when compiled
+            # with mypyc), the robot keeps its old timestamp, so a retransmit of
+            # this sample is not dropped as a duplicate
+            robot.timestamp = timestamp
             
             # Notify callbacks
             for callback in self.update_callbacks:
                 try:
                     callback(robot_id, robot)
                 except Exception as e:
-                    print(f"Error in update callback: {e}")
+                    logger.error("Error in update callback: %s", e)
+            
+            if not was_connected:
+                self._notify_topology()
                     
         except Exception as e:
-            print(f"Error processing robot data: {e}")
+            logger.error("Error processing robot data: %s", e)
             
-    def _cleanup_expired_robots(self):
+    def _cleanup_expired_robots(self) -> None:
         """Thread function to cleanup robots that haven't sent data recently"""
+        # Loop-invariant lookups bound once as locals
+        monotonic = time.monotonic
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        heap = self._expiry_heap
+        scheduled = self._scheduled
+        expiry_lock = self._expiry_lock
+        timeout_seconds = self.timeout_seconds
+        robots = self.robots
+        callbacks = self.update_callbacks
+        wake = self._cleanup_wake
+        
         while self.running:
+            # Fallback wake-up if the sweep below fails before computing a deadline
+            next_deadline = monotonic() + 1.0
             try:
-                current_time = datetime.now()
-                timeout_delta = timedelta(seconds=self.timeout_seconds)
+                current_time = monotonic()
                 
+                # Single pass over the due heap entries: a connected robot that sent
+                # data since its entry was pushed is rescheduled; otherwise it has
+                # timed out and is scheduled again for removal. A disconnected one
+                # has been silent long enough to be removed.
                 expired_robots = []
-                for robot_id, robot in self.robots.items():
-                    if current_time - robot.last_update > timeout_delta:
-                        expired_robots.append(robot_id)
-                        robot.is_connected = False
+                removed_robots = []
+                with expiry_lock:
+                    while heap and heap[0][0] <= current_time:
+                        deadline, robot_id = heappop(heap)
+                        if scheduled.get(robot_id) != deadline:
+                            continue  # Replaced when the robot reconnected
+                        robot = robots.get(robot_id)
+                        if robot is None:
+                            del scheduled[robot_id]
+                            continue
+                        if robot.is_connected:
+                            deadline = robot.last_update + timeout_seconds
+                            if deadline <= current_time:
+                                robot.is_connected = False
+                                expired_robots.append(robot)
+                                deadline = robot.last_update + ROBOT_REMOVAL_SECONDS
+                            scheduled[robot_id] = deadline
+                            heappush(heap, (deadline, robot_id))
+                        else:
+                            del robots[robot_id]
+                            del scheduled[robot_id]
+                            removed_robots.append(robot_id)
+                            
+                    # With an empty heap, any future packet is due a full timeout from
+                    # now. Published under the lock, so an earlier entry pushed after
+                    # this point sets the wake event again.
+                    next_deadline = heap[0][0] if heap else current_time + timeout_seconds
+                    self._cleanup_deadline = next_deadline
+                    wake.clear()
                         
                 # Notify callbacks about disconnected robots
-                for robot_id in expired_robots:
-                    for callback in self.update_callbacks:
+                for robot in expired_robots:
+                    for callback in callbacks:
                         try:
-                            callback(robot_id, self.robots[robot_id])
+                            callback(robot.robot_id, robot)
                         except Exception as e:
-                            print(f"Error in disconnect callback: {e}")
+                            logger.error("Error in disconnect callback: %s", e)
                             
-                # Remove very old robots (after 30 seconds)
-                very_old_delta = timedelta(seconds=30)
-                for robot_id in list(self.robots.keys()):
-                    if current_time - self.robots[robot_id].last_update > very_old_delta:
-                        print(f"Removing very old robot {robot_id}")
-                        del self.robots[robot_id]
+                if removed_robots:
+                    for robot_id in removed_robots:
+                        logger.info("Removing very old robot %d", robot_id)
+                    self._publish_snapshot()
+                    
+                if expired_robots or removed_robots:
+                    self._notify_topology()
                         
             except Exception as e:
-                print(f"Error in cleanup thread: {e}")
+                logger.error("Error in cleanup thread: %s", e)
                 
-            time.sleep(1.0)  # Check every second
+            # stop() clears running before setting the event, so a set() erased
+            # by the clear above is caught here instead of sleeping to the deadline
+            if not self.running:
+                return
+            # Returns early on stop() or when a robot is due before next_deadline
+            wake.wait(max(0.0, next_deadline - monotonic()))
             
-    def get_robots(self) -> Dict[int, RobotData]:
-        """Get current robot data"""
-        return self.robots.copy()
+    def _notify_topology(self) -> None:
+        """Call the topology callbacks with the current robot view"""
+        robots = self._robots_snapshot
+        for callback in self.topology_callbacks:
+            try:
+                callback(robots)
+            except Exception as e:
+                logger.error("Error in topology callback: %s", e)
+                
+    def _publish_snapshot(self) -> None:
+        """Atomically replace the read-only robot view after membership changes
+        
+        Robots join on the packet-processing thread and leave on the cleanup
+        thread. Copy and assignment happen under a lock, so the last view
+        published is always the newest; otherwise a stale copy could
+        overwrite a newer one.
+        """
+        with self._snapshot_lock:
+            self._robots_snapshot = MappingProxyType(self.robots.copy())
+        
+    def get_robots(self) -> Mapping[int, RobotData]:
+        """Get current robot data (read-only view, no copy)"""
+        return self._robots_snapshot
         
     def get_connected_robots(self) -> Dict[int, RobotData]:
         """Get only connected robots"""
-        return {rid: robot for rid, robot in self.robots.items() if robot.is_connected}
+        return {rid: robot for rid, robot in self._robots_snapshot.items() if robot.is_connected}
         
     def send_command_to_robot(self, robot_ip: str, command: Dict[str, Any]) -> bool:
         """Send command to specific robot (placeholder for future implementation)"""
         # TODO: Implement robot command sending
-        print(f"Would send command to {robot_ip}: {command}")
+        logger.info("Would send command to %s: %s", robot_ip, command)
         return True
 
 
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that discards records instead of blocking when the queue is full"""
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_logging(level: int = logging.INFO, max_queued: int = 1000) -> logging.handlers.QueueListener:
+    """Route all logging through a bounded queue drained by a background thread
+    
+    Threads that log (e.g. the packet parser) only enqueue records; the slow
+    console write happens on the listener thread. Call ``stop()`` on the
+    returned listener at shutdown to flush pending records.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=max_queued)
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_DroppingQueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
 if __name__ == "__main__":
     # Test the dashboard core
+    log_listener = setup_logging()
+    
     def on_robot_update(robot_id: int, robot_data: RobotData):
         status = "CONNECTED" if robot_data.is_connected else "DISCONNECTED"
         print(f"Robot {robot_id} ({robot_data.robot_name}): {status} - "
@@ -308,4 +827,5 @@ if __name__ == "__main__":
             time.sleep(1)
     except KeyboardInterrupt:
         print("\nStopping dashboard...")
-        dashboard.stop() 
\ No newline at end of file
+        dashboard.stop()
+        log_listener.stop() 
\ No newline at end of file
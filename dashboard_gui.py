@@ -2,12 +2,13 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import math
-from typing import Dict, Optional
-from datetime import datetime
+import queue
+import time
+from typing import Dict, Mapping, Optional, Tuple
+import numpy as np
 import sv_ttk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 
 from dashboard_core import DashboardCore, RobotData
 
@@ -41,6 +42,10 @@ FONTS = {
     'mono': ('Consolas', 9),
 }
 
+# Robot ID labels use the subheading font. Spelled out with an exact tuple type:
+# the Tk stubs reject FONTS' inferred Tuple[Union[str, int], ...] for canvas items.
+ROBOT_LABEL_FONT: Tuple[str, int, str] = ('Segoe UI', 10, 'bold')
+
 
 class ModernFrame(tk.Frame):
     """A modern styled frame with rounded corners effect"""
@@ -49,169 +54,129 @@ class ModernFrame(tk.Frame):
         super().__init__(parent, bg=bg_color, relief='flat', bd=0, **kwargs)
 
 
-class StatusIndicator(tk.Label):
-    """Modern status indicator with better styling"""
-    def __init__(self, parent, **kwargs):
-        super().__init__(parent, font=('Segoe UI', 12), **kwargs)
-        self.configure(bg=COLORS['bg_tertiary'])
+class RobotStatusTable(ModernFrame):
+    """Robot status as one Treeview row per robot
     
-    def set_status(self, connected: bool):
-        if connected:
-            self.configure(text="●", fg=COLORS['success'])
-        else:
-            self.configure(text="●", fg=COLORS['danger'])
-
-
-class RobotStatusFrame(ModernFrame):
-    """Modern robot status card"""
+    Cells are only rewritten when their text changes, and row color comes
+    from Treeview tags rather than per-widget foreground changes.
+    """
     
-    def __init__(self, parent, robot_id: int):
-        super().__init__(parent, bg_color=COLORS['bg_tertiary'])
-        self.robot_id = robot_id
-        self.robot_data: Optional[RobotData] = None
-        
-        self.configure(relief='solid', bd=1, highlightbackground=COLORS['border'])
-        self.setup_widgets()
-        
-    def setup_widgets(self):
-        """Setup modern robot status display"""
-        # Set fixed width for the entire frame
-        self.configure(padx=8, pady=8, width=420, height=320)
-        self.pack_propagate(False)  # Prevent the frame from shrinking to fit content
-        
-        # Header section
-        header = ModernFrame(self, bg_color=COLORS['bg_secondary'])
-        header.pack(fill=tk.X, pady=(0, 8))
-        
-        self.name_label = tk.Label(header, text=f"Robot {self.robot_id}", 
-                                  font=FONTS['heading'], fg=COLORS['text_primary'],
-                                  bg=COLORS['bg_secondary'])
-        self.name_label.pack(side=tk.LEFT, padx=8, pady=6)
-        
-        self.status_indicator = StatusIndicator(header)
-        self.status_indicator.pack(side=tk.RIGHT, padx=8, pady=6)
-        
-        # Info grid with fixed spacing
-        info_container = ModernFrame(self)
-        info_container.pack(fill=tk.BOTH, expand=True, padx=4)
-        
-        self.info_labels = {}
-        self.info_values = {}
-        
-        info_items = [
-            ('Game State', 'game_state', 'UNKNOWN'),
-            ('Position', 'position', '(0.0, 0.0)'),
-            ('Static Role', 'role', 'unknown'),
-            ('Dynamic Role', 'dynamic_role', 'unknown'),
-            ('Ball Status', 'ball', 'Not detected'),
-            ('Possession', 'possession', 'No'),
-            ('Ball Cost', 'ball_cost', '0.0'),
-            ('Decision', 'decision', 'unknown'),
-            ('Loop Time', 'performance', '0.0ms')
-        ]
-        
-        for i, (label_text, key, default_value) in enumerate(info_items):
-            # Label with fixed width
-            label = tk.Label(info_container, text=f"{label_text}:", 
-                           font=FONTS['caption'], fg=COLORS['text_secondary'],
-                           bg=COLORS['bg_tertiary'], anchor='w', width=12)
-            label.grid(row=i, column=0, sticky='w', padx=(4, 8), pady=2)
-            
-            # Value with fixed width to prevent resizing
-            value = tk.Label(info_container, text=default_value,
-                           font=FONTS['body'], fg=COLORS['text_primary'],
-                           bg=COLORS['bg_tertiary'], anchor='w', width=25)
-            value.grid(row=i, column=1, sticky='w', padx=(0, 4), pady=2)
-            
-            self.info_labels[key] = label
-            self.info_values[key] = value
-        
-        # Configure grid with fixed column widths
-        info_container.grid_columnconfigure(0, weight=0, minsize=100)
-        info_container.grid_columnconfigure(1, weight=0, minsize=250)
+    COLUMNS = (
+        ('name', 'Robot', 70),
+        ('game_state', 'State', 65),
+        ('position', 'Position', 80),
+        ('role', 'Role', 85),
+        ('ball', 'Ball', 80),
+        ('possession', 'Possession', 75),
+        ('ball_cost', 'Ball Cost', 60),
+        ('performance', 'Loop', 55),
+        ('decision', 'Decision', 95),
+    )
+    
+    def __init__(self, parent):
+        super().__init__(parent, bg_color=COLORS['bg_secondary'])
+        
+        self.tree = ttk.Treeview(self, columns=[key for key, _, _ in self.COLUMNS],
+                                 show='headings', selectmode='none')
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading, anchor='w')
+            self.tree.column(key, width=width, minwidth=40, anchor='w', stretch=True)
+        
+        # Whole-row colors: disconnected robots fade out, possession and slow loops stand out
+        self.tree.tag_configure('good', foreground=COLORS['text_primary'])
+        self.tree.tag_configure('disconnected', foreground=COLORS['text_muted'])
+        self.tree.tag_configure('possession', foreground=COLORS['warning'])
+        self.tree.tag_configure('slow', foreground=COLORS['danger'])
+        
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
         
-    def update_data(self, robot_data: RobotData):
-        """Update with modern styling and colors"""
-        self.robot_data = robot_data
+        # Last cell values and tag per robot row, to skip redundant Tk calls
+        self._rows: Dict[int, Tuple[Tuple[str, ...], str]] = {}
         
-        # Update connection status and name
-        self.status_indicator.set_status(robot_data.is_connected)
+    @staticmethod
+    def format_row(robot_id: int, robot_data: RobotData) -> Tuple[Tuple[str, ...], str]:
+        """Cell texts (in COLUMNS order) and row tag for a robot"""
         if robot_data.is_connected:
-            self.name_label.config(text=robot_data.robot_name, fg=COLORS['text_primary'])
+            name = robot_data.robot_name
         else:
-            self.name_label.config(text=f"Robot {self.robot_id}", fg=COLORS['text_muted'])
-            
-        # Update game state with color coding
-        game_state_color = COLORS['text_primary']
-        if robot_data.game_state in ['PLAYING', 'READY']:
-            game_state_color = COLORS['success']
-        elif robot_data.game_state in ['PENALIZED', 'FINISHED', 'SET']:
-            game_state_color = COLORS['danger']
-            
-        self.info_values['game_state'].config(text=robot_data.game_state, fg=game_state_color)
-        
-        # Update position
-        self.info_values['position'].config(text=f"({robot_data.pose_x:.1f}, {robot_data.pose_y:.1f})")
-        
-        # Update static role
-        self.info_values['role'].config(text=robot_data.role)
+            name = f"Robot {robot_id}"
         
-        # Update dynamic role with color coding
-        dynamic_role_text = f"{robot_data.dynamic_role}"
-        dynamic_role_color = COLORS['text_primary']
         if robot_data.dynamic_role == -1:
-            dynamic_role_text = "unassigned"
-            dynamic_role_color = COLORS['text_muted']
-        self.info_values['dynamic_role'].config(text=dynamic_role_text, fg=dynamic_role_color)
+            role = f"{robot_data.role} / -"
+        else:
+            role = f"{robot_data.role} / {robot_data.dynamic_role}"
         
-        # Update ball detection with colors
         if robot_data.ball_detected:
-            ball_text = f"Detected ({robot_data.ball_x:.1f}, {robot_data.ball_y:.1f})"
-            ball_color = COLORS['success']
+            ball = f"({robot_data.ball_x:.1f}, {robot_data.ball_y:.1f})"
         else:
-            ball_text = "Not detected"
-            ball_color = COLORS['text_muted']
-        self.info_values['ball'].config(text=ball_text, fg=ball_color)
+            ball = "Not detected"
         
-        # Update possession status with detailed info
         if robot_data.has_possession:
-            possession_text = "Yes (This Robot)"
-            possession_color = COLORS['warning']
+            possession = "This robot"
         elif robot_data.possession_player != -1:
-            possession_text = f"Robot {robot_data.possession_player}"
-            possession_color = COLORS['text_secondary']
-        else:
-            possession_text = "Unknown"
-            possession_color = COLORS['text_muted']
-        self.info_values['possession'].config(text=possession_text, fg=possession_color)
-        
-        # Update ball cost with color coding
-        ball_cost_color = COLORS['text_primary']
-        if robot_data.ball_cost < 0.5:
-            ball_cost_color = COLORS['success']  # Low cost (close to ball)
-        elif robot_data.ball_cost < 1.0:
-            ball_cost_color = COLORS['warning']  # Medium cost
+            possession = f"Robot {robot_data.possession_player}"
         else:
-            ball_cost_color = COLORS['danger']   # High cost (far from ball)
-        self.info_values['ball_cost'].config(text=f"{robot_data.ball_cost:.2f}", fg=ball_cost_color)
-            
-        # Update performance with color coding
+            possession = "Unknown"
+        
         loop_time_ms = robot_data.avg_loop_time * 1000
-        perf_color = COLORS['success'] if loop_time_ms < 50 else COLORS['warning'] if loop_time_ms < 100 else COLORS['danger']
-        self.info_values['performance'].config(text=f"{loop_time_ms:.1f}ms", fg=perf_color)
         
-        # Update decision
-        self.info_values['decision'].config(text=robot_data.decision)
+        if not robot_data.is_connected:
+            tag = 'disconnected'
+        elif loop_time_ms >= 100:
+            tag = 'slow'
+        elif robot_data.has_possession:
+            tag = 'possession'
+        else:
+            tag = 'good'
+        
+        values = (name, robot_data.game_state,
+                  f"({robot_data.pose_x:.1f}, {robot_data.pose_y:.1f})",
+                  role, ball, possession, f"{robot_data.ball_cost:.2f}",
+                  f"{loop_time_ms:.1f}ms", robot_data.decision)
+        return values, tag
+        
+    def update_robot(self, robot_id: int, robot_data: RobotData):
+        """Insert or update the robot's row, touching only cells that changed"""
+        values, tag = self.format_row(robot_id, robot_data)
+        iid = str(robot_id)
+        
+        last = self._rows.get(robot_id)
+        if last is None:
+            self.tree.insert('', 'end', iid=iid, values=values, tags=(tag,))
+        elif last != (values, tag):
+            last_values, last_tag = last
+            for (key, _, _), value, last_value in zip(self.COLUMNS, values, last_values):
+                if value != last_value:
+                    self.tree.set(iid, key, value)
+            if tag != last_tag:
+                self.tree.item(iid, tags=(tag,))
+        self._rows[robot_id] = (values, tag)
+        
+    def remove_missing(self, robots: Mapping[int, RobotData]):
+        """Delete the rows of robots that are no longer in ``robots``"""
+        for robot_id in [rid for rid in self._rows if rid not in robots]:
+            del self._rows[robot_id]
+            self.tree.delete(str(robot_id))
 
 
 class ModernFieldCanvas(tk.Canvas):
-    """Beautiful modern soccer field visualization"""
+    """Beautiful modern soccer field visualization
+    
+    By default robots are persistent canvas items moved with coords(). With
+    ``raster=True`` the field and robots are instead drawn into an offscreen
+    PIL image that is copied into the single background PhotoImage whenever
+    a robot changes, so Tk only ever displays one image item.
+    """
     
-    def __init__(self, parent, width=700, height=500):
+    def __init__(self, parent, width=700, height=500, raster=False):
         super().__init__(parent, width=width, height=height, 
                         bg=COLORS['field_green'], highlightthickness=0)
         self.canvas_width = width
         self.canvas_height = height
+        self.raster = raster
         
         # Field dimensions
         self.field_width = 9.0
@@ -221,11 +186,45 @@ class ModernFieldCanvas(tk.Canvas):
         self.scale_x = (width - 60) / self.field_width
         self.scale_y = (height - 60) / self.field_height
         
+        # field_to_canvas as one multiply-add per axis (30 px field margin)
+        self._ax = self.scale_x
+        self._bx = self.field_width / 2 * self.scale_x + 30
+        self._ay = -self.scale_y
+        self._by = self.field_height / 2 * self.scale_y + 30
+        
+        # cos/sin per whole degree for the heading indicators; at 20 px the
+        # rounding error stays below a fifth of a pixel
+        angles = np.radians(np.arange(360))
+        self._dir_lut = np.column_stack((np.cos(angles), np.sin(angles)))
+        
+        # Canvas item ids per robot, and the state they were last drawn with
+        # (None while the robot is hidden)
+        self._robot_items: Dict[int, Dict[str, int]] = {}
+        self._last_robot_state: Dict[int, Optional[tuple]] = {}
+        
+        # Raster mode: robot states of the last rendered frame
+        self._last_frame_state: Optional[tuple] = None
+        self._label_font = ImageFont.load_default()
+        
         self.draw_modern_field()
         
     def draw_modern_field(self):
-        """Draw a beautiful modern soccer field"""
-        self.delete("all")
+        """Draw the static field as a single background image"""
+        self._field_image = self.render_field_image()
+        self._field_bg = ImageTk.PhotoImage(self._field_image)
+        
+        self.delete("field_bg")
+        self.create_image(0, 0, anchor='nw', image=self._field_bg, tags="field_bg")
+        self.tag_lower("field_bg")
+        
+    def render_field_image(self) -> Image.Image:
+        """Render a beautiful modern soccer field into an offscreen image
+        
+        The field never changes, so it is drawn once with PIL instead of as
+        ~25 canvas items that Tk has to manage and repaint.
+        """
+        image = Image.new('RGB', (self.canvas_width, self.canvas_height), COLORS['field_dark'])
+        draw = ImageDraw.Draw(image)
         
         # Field margins
         margin = 30
@@ -234,37 +233,20 @@ class ModernFieldCanvas(tk.Canvas):
         field_top = margin
         field_bottom = self.canvas_height - margin
         
-        # Create gradient effect background
-        self.create_rectangle(0, 0, self.canvas_width, self.canvas_height, 
-                            fill=COLORS['field_dark'], outline="")
-        
-        # Main field area with lighter green
-        self.create_rectangle(field_left, field_top, field_right, field_bottom, 
-                            fill=COLORS['field_green'], outline="")
+        # Main field area with lighter green and white border
+        draw.rectangle((field_left, field_top, field_right, field_bottom),
+                       fill=COLORS['field_green'], outline='white', width=3)
         
-        # Field border with modern styling
-        self.create_rectangle(field_left, field_top, field_right, field_bottom, 
-                            outline='white', width=3)
-        
-        # Center line with glow effect
+        # Center line
         center_x = self.canvas_width // 2
-        # Shadow/glow effect
-        self.create_line(center_x+1, field_top+1, center_x+1, field_bottom+1, 
-                        fill='#666666', width=4)
-        self.create_line(center_x, field_top, center_x, field_bottom, 
-                        fill='white', width=3)
+        draw.line((center_x, field_top, center_x, field_bottom), fill='white', width=3)
         
         # Center circle with modern styling
         center_y = self.canvas_height // 2
         circle_radius = 1.5 * min(self.scale_x, self.scale_y)
-        # Shadow
-        self.create_oval(center_x - circle_radius + 2, center_y - circle_radius + 2,
-                        center_x + circle_radius + 2, center_y + circle_radius + 2,
-                        outline='#666666', width=4)
-        # Main circle
-        self.create_oval(center_x - circle_radius, center_y - circle_radius,
-                        center_x + circle_radius, center_y + circle_radius,
-                        outline='white', width=3)
+        draw.ellipse((center_x - circle_radius, center_y - circle_radius,
+                      center_x + circle_radius, center_y + circle_radius),
+                     outline='white', width=3)
         
         # Modern goals with gradient effect
         goal_width = 1.5 * self.scale_y
@@ -273,14 +255,12 @@ class ModernFieldCanvas(tk.Canvas):
         goal_y_end = center_y + goal_width // 2
         
         # Left goal with modern styling
-        self.create_rectangle(field_left - goal_depth, goal_y_start,
-                            field_left, goal_y_end,
-                            fill='#e6f3ff', outline='white', width=3)
+        draw.rectangle((field_left - goal_depth, goal_y_start, field_left, goal_y_end),
+                       fill='#e6f3ff', outline='white', width=3)
         
         # Right goal
-        self.create_rectangle(field_right, goal_y_start,
-                            field_right + goal_depth, goal_y_end,
-                            fill='#ffe6e6', outline='white', width=3)
+        draw.rectangle((field_right, goal_y_start, field_right + goal_depth, goal_y_end),
+                       fill='#ffe6e6', outline='white', width=3)
         
         # Goal areas with subtle styling
         goal_area_width = 3.0 * self.scale_y
@@ -289,95 +269,197 @@ class ModernFieldCanvas(tk.Canvas):
         goal_area_y_end = center_y + goal_area_width // 2
         
         # Left goal area
-        self.create_rectangle(field_left, goal_area_y_start,
-                            field_left + goal_area_depth, goal_area_y_end,
-                            outline='white', width=2)
+        draw.rectangle((field_left, goal_area_y_start, field_left + goal_area_depth, goal_area_y_end),
+                       outline='white', width=2)
         
         # Right goal area
-        self.create_rectangle(field_right - goal_area_depth, goal_area_y_start,
-                            field_right, goal_area_y_end,
-                            outline='white', width=2)
+        draw.rectangle((field_right - goal_area_depth, goal_area_y_start, field_right, goal_area_y_end),
+                       outline='white', width=2)
         
         # Add corner arcs for extra detail
         corner_radius = 20
-        # Top-left corner
-        self.create_arc(field_left - corner_radius, field_top - corner_radius,
-                       field_left + corner_radius, field_top + corner_radius,
-                       start=0, extent=90, outline='white', width=2, style='arc')
+        # Top-left corner (PIL measures angles clockwise from 3 o'clock)
+        draw.arc((field_left - corner_radius, field_top - corner_radius,
+                  field_left + corner_radius, field_top + corner_radius),
+                 start=270, end=360, fill='white', width=2)
         
-        # Add field texture lines
-        for i in range(1, 8):
-            x = field_left + (field_right - field_left) * i / 8
-            self.create_line(x, field_top, x, field_bottom, 
-                           fill='#228B22', width=1, stipple='gray50')
+        return image
         
     def field_to_canvas(self, x, y):
-        """Convert field coordinates to canvas coordinates"""
-        canvas_x = (x + self.field_width/2) * self.scale_x + 30
-        canvas_y = (-y + self.field_height/2) * self.scale_y + 30
-        return canvas_x, canvas_y
+        """Convert field coordinates to canvas coordinates (also works on NumPy arrays)"""
+        return x * self._ax + self._bx, y * self._ay + self._by
+        
+    def _create_robot_items(self, robot_id: int) -> Dict[str, int]:
+        """Create the canvas items for one robot, hidden until first placed"""
+        tags = ("robot", f"robot{robot_id}")
+        ball_tags = ("ball", f"robot{robot_id}")
+        items = {
+            # Main robot circle
+            'body': self.create_oval(0, 0, 0, 0, width=3, state='hidden', tags=tags),
+            # Robot ID with better visibility
+            'label': self.create_text(0, 0, text=str(robot_id), fill='white',
+                                      font=ROBOT_LABEL_FONT, state='hidden', tags=tags),
+            # Direction line with gradient effect
+            'direction_glow': self.create_line(0, 0, 0, 0, fill='white', width=4,
+                                               state='hidden', tags=tags),
+            'direction': self.create_line(0, 0, 0, 0, width=2, state='hidden', tags=tags),
+            # Ball
+            'ball': self.create_oval(0, 0, 0, 0, fill='#ff8c00', outline='#ff7f00', width=2,
+                                     state='hidden', tags=ball_tags),
+        }
+        self._robot_items[robot_id] = items
+        self._last_robot_state[robot_id] = None
+        return items
+        
+    @staticmethod
+    def robot_colors(has_possession: bool, team_id: int) -> Tuple[str, str]:
+        """Fill and border color of a robot marker"""
+        if has_possession:
+            return COLORS['warning'], '#f39c12'
+        if team_id == 1:
+            return COLORS['accent'], COLORS['accent_light']
+        return COLORS['danger'], '#ff6b6b'
         
     def update_robots(self, robots: Dict[int, RobotData]):
-        """Update robots with modern 3D-like visualization"""
-        self.delete("robot")
-        self.delete("ball")
+        """Update robot and ball markers on the field
+        
+        Each robot keeps its canvas items for its whole lifetime; only the
+        coordinates and colors of robots whose state changed are touched.
+        """
+        if self.raster:
+            self._render_robots_raster(robots)
+            return
+        
+        # Per-frame attribute lookups bound once as locals
+        robot_items = self._robot_items
+        last_robot_state = self._last_robot_state
+        coords = self.coords
+        itemconfigure = self.itemconfigure
         
+        # Drop items of robots the core has forgotten about
+        for robot_id in [rid for rid in robot_items if rid not in robots]:
+            self.delete(f"robot{robot_id}")
+            del robot_items[robot_id]
+            del last_robot_state[robot_id]
+        
+        robot_size = 12
+        direction_length = 20
+        
+        # First pass: find the robots whose drawn state changed
+        moved = []
         for robot_id, robot in robots.items():
-            if not robot.is_connected:
-                continue
-                
-            canvas_x, canvas_y = self.field_to_canvas(robot.pose_x, robot.pose_y)
-            
-            # Robot with modern styling and shadow
-            robot_size = 12
+            items = robot_items.get(robot_id)
+            if items is None:
+                items = self._create_robot_items(robot_id)
             
-            # Determine robot color
-            if robot.has_possession:
-                robot_color = COLORS['warning']
-                border_color = '#f39c12'
-            elif robot.team_id == 1:
-                robot_color = COLORS['accent']
-                border_color = COLORS['accent_light']
+            if robot.is_connected:
+                state = (robot.pose_x, robot.pose_y, robot.pose_theta, robot.has_possession,
+                         robot.team_id, robot.ball_detected, robot.ball_x, robot.ball_y)
             else:
-                robot_color = COLORS['danger']
-                border_color = '#ff6b6b'
+                state = None
             
-            # Drop shadow
-            self.create_oval(canvas_x - robot_size + 2, canvas_y - robot_size + 2,
-                           canvas_x + robot_size + 2, canvas_y + robot_size + 2,
-                           fill='#333333', outline='', tags="robot")
+            last_state = last_robot_state[robot_id]
+            if state == last_state:
+                continue
+            last_robot_state[robot_id] = state
             
-            # Main robot circle
-            self.create_oval(canvas_x - robot_size, canvas_y - robot_size,
-                           canvas_x + robot_size, canvas_y + robot_size,
-                           fill=robot_color, outline=border_color, width=3, tags="robot")
+            if state is None:
+                itemconfigure(f"robot{robot_id}", state='hidden')
+                continue
+            moved.append((robot_id, items, last_state, state))
             
-            # Robot ID with better visibility
-            self.create_text(canvas_x, canvas_y, text=str(robot_id), 
-                           fill='white', font=FONTS['subheading'], tags="robot")
+        if not moved:
+            return
+        
+        # Transform all changed robots at once, structure-of-arrays style
+        count = len(moved)
+        poses = np.array([entry[3] for entry in moved], dtype=np.float64).reshape(count, -1)
+        canvas_xs, canvas_ys = self.field_to_canvas(poses[:, 0], poses[:, 1])
+        ball_xs, ball_ys = self.field_to_canvas(poses[:, 6], poses[:, 7])
+        
+        # Direction indicator with modern styling
+        directions = self._dir_lut[np.rint(np.degrees(poses[:, 2])).astype(np.intp) % 360]
+        end_xs = canvas_xs + direction_length * directions[:, 0]
+        end_ys = canvas_ys - direction_length * directions[:, 1]
+        
+        # Second pass: issue the Tk calls with plain Python floats, reading
+        # flags from the state tuple instead of the live RobotData
+        for (robot_id, items, last_state, state), canvas_x, canvas_y, end_x, end_y, \
+                ball_canvas_x, ball_canvas_y in zip(moved, canvas_xs.tolist(), canvas_ys.tolist(),
+                                                    end_xs.tolist(), end_ys.tolist(),
+                                                    ball_xs.tolist(), ball_ys.tolist()):
+            has_possession, team_id, ball_detected = state[3:6]
             
-            # Direction indicator with modern styling
-            direction_length = 20
-            end_x = canvas_x + direction_length * math.cos(robot.pose_theta)
-            end_y = canvas_y - direction_length * math.sin(robot.pose_theta)
+            coords(items['body'], canvas_x - robot_size, canvas_y - robot_size,
+                   canvas_x + robot_size, canvas_y + robot_size)
+            coords(items['label'], canvas_x, canvas_y)
+            coords(items['direction_glow'], canvas_x, canvas_y, end_x, end_y)
+            coords(items['direction'], canvas_x, canvas_y, end_x, end_y)
             
-            # Direction line with gradient effect
-            self.create_line(canvas_x, canvas_y, end_x, end_y,
-                           fill='white', width=4, tags="robot")
-            self.create_line(canvas_x, canvas_y, end_x, end_y,
-                           fill=border_color, width=2, tags="robot")
+            # Recolor only when possession or team changed
+            if last_state is None or last_state[3:5] != (has_possession, team_id):
+                robot_color, border_color = self.robot_colors(has_possession, team_id)
+                itemconfigure(items['body'], fill=robot_color, outline=border_color)
+                itemconfigure(items['direction'], fill=border_color)
+            
+            if last_state is None:
+                itemconfigure(f"robot{robot_id}", state='normal')
             
             # Ball visualization
-            if robot.ball_detected:
-                ball_canvas_x, ball_canvas_y = self.field_to_canvas(robot.ball_x, robot.ball_y)
-                # Ball shadow
-                self.create_oval(ball_canvas_x - 6 + 1, ball_canvas_y - 6 + 1,
-                               ball_canvas_x + 6 + 1, ball_canvas_y + 6 + 1,
-                               fill='#333333', outline='', tags="ball")
-                # Ball
-                self.create_oval(ball_canvas_x - 6, ball_canvas_y - 6,
-                               ball_canvas_x + 6, ball_canvas_y + 6,
-                               fill='#ff8c00', outline='#ff7f00', width=2, tags="ball")
+            if ball_detected:
+                coords(items['ball'], ball_canvas_x - 6, ball_canvas_y - 6,
+                       ball_canvas_x + 6, ball_canvas_y + 6)
+            if last_state is None or last_state[5] != ball_detected:
+                itemconfigure(items['ball'], state='normal' if ball_detected else 'hidden')
+                
+    def _render_robots_raster(self, robots: Dict[int, RobotData]):
+        """Redraw field and robots offscreen and show them, if any robot changed"""
+        frame_state = tuple((robot_id, robot.pose_x, robot.pose_y, robot.pose_theta,
+                             robot.has_possession, robot.team_id, robot.ball_detected,
+                             robot.ball_x, robot.ball_y)
+                            for robot_id, robot in robots.items() if robot.is_connected)
+        if frame_state == self._last_frame_state:
+            return
+        self._last_frame_state = frame_state
+        
+        robot_size = 12
+        direction_length = 20
+        field_to_canvas = self.field_to_canvas
+        dir_lut = self._dir_lut
+        
+        image = self._field_image.copy()
+        draw = ImageDraw.Draw(image)
+        balls = []
+        for (robot_id, pose_x, pose_y, pose_theta, has_possession, team_id,
+             ball_detected, ball_x, ball_y) in frame_state:
+            canvas_x, canvas_y = field_to_canvas(pose_x, pose_y)
+            robot_color, border_color = self.robot_colors(has_possession, team_id)
+            
+            # Main robot circle
+            draw.ellipse((canvas_x - robot_size, canvas_y - robot_size,
+                          canvas_x + robot_size, canvas_y + robot_size),
+                         fill=robot_color, outline=border_color, width=3)
+            
+            # Robot ID
+            draw.text((canvas_x, canvas_y), str(robot_id), fill='white',
+                      font=self._label_font, anchor='mm')
+            
+            # Direction indicator
+            cos_theta, sin_theta = dir_lut[round(math.degrees(pose_theta)) % 360]
+            end = (canvas_x + direction_length * cos_theta, canvas_y - direction_length * sin_theta)
+            draw.line(((canvas_x, canvas_y), end), fill='white', width=4)
+            draw.line(((canvas_x, canvas_y), end), fill=border_color, width=2)
+            
+            if ball_detected:
+                balls.append(field_to_canvas(ball_x, ball_y))
+        
+        # Balls on top of all robots, as in vector mode
+        for ball_canvas_x, ball_canvas_y in balls:
+            draw.ellipse((ball_canvas_x - 6, ball_canvas_y - 6, ball_canvas_x + 6, ball_canvas_y + 6),
+                         fill='#ff8c00', outline='#ff7f00', width=2)
+        
+        # Update the existing PhotoImage in place; the canvas item stays the same
+        self._field_bg.paste(image)
 
 
 class ModernButton(tk.Button):
@@ -409,9 +491,13 @@ class ModernButton(tk.Button):
 class ControlPanel(ModernFrame):
     """Modern control panel"""
     
+    # How long command confirmations stay visible
+    TOAST_MS = 1500
+    
     def __init__(self, parent, dashboard_core: DashboardCore):
         super().__init__(parent)
         self.dashboard_core = dashboard_core
+        self._last_robot_list: Tuple[str, ...] = ("All Robots",)
         self.setup_widgets()
         
     def setup_widgets(self):
@@ -456,30 +542,57 @@ class ControlPanel(ModernFrame):
                                    command=self.send_emergency_stop, style='danger')
         emergency_btn.pack(fill=tk.X, padx=4, pady=4)
         
+        # Command confirmation, packed only while a toast is showing
+        self.toast_label = tk.Label(self, font=FONTS['body'], fg=COLORS['button_text'],
+                                    bg=COLORS['accent'], anchor='w', padx=8, pady=4)
+        self._toast_job = None
+        
     def update_robot_list(self, robots: Dict[int, RobotData]):
         """Update robot dropdown"""
-        robot_names = ["All Robots"] + [f"Robot {rid} ({robot.robot_name})" 
-                                       for rid, robot in robots.items() if robot.is_connected]
-        self.robot_combo['values'] = robot_names
+        robot_names = ("All Robots",) + tuple(f"Robot {rid} ({robot.robot_name})"
+                                              for rid, robot in robots.items() if robot.is_connected)
+        if robot_names == self._last_robot_list:
+            return
+        self.robot_combo['values'] = list(robot_names)
+        self._last_robot_list = robot_names
+        
+    def _toast(self, message: str, level: str = 'primary'):
+        """Briefly show a confirmation inside the panel
+        
+        Unlike a messagebox this does not run a nested event loop, so the
+        dashboard keeps redrawing. Never call update() here or elsewhere in
+        the GUI, only update_idletasks().
+        """
+        if self._toast_job is not None:
+            self.after_cancel(self._toast_job)
+        colors = {'primary': COLORS['accent'], 'success': COLORS['success'],
+                  'warning': COLORS['warning'], 'danger': COLORS['danger']}
+        self.toast_label.config(text=message, bg=colors.get(level, COLORS['accent']))
+        self.toast_label.pack(fill=tk.X, padx=8, pady=(4, 8))
+        self._toast_job = self.after(self.TOAST_MS, self._hide_toast)
+        
+    def _hide_toast(self):
+        self._toast_job = None
+        self.toast_label.pack_forget()
         
     def send_build_command(self):
         target = self.robot_var.get()
-        messagebox.showinfo("Command", f"Build command sent to: {target}")
+        self._toast(f"Build command sent to: {target}")
         
     def send_start_command(self):
         target = self.robot_var.get()
-        messagebox.showinfo("Command", f"Start command sent to: {target}")
+        self._toast(f"Start command sent to: {target}", 'success')
         
     def send_stop_command(self):
         target = self.robot_var.get()
-        messagebox.showinfo("Command", f"Stop command sent to: {target}")
+        self._toast(f"Stop command sent to: {target}", 'warning')
         
     def send_emergency_stop(self):
         result = messagebox.askyesno("Emergency Stop", 
                                     "Send EMERGENCY STOP to ALL robots?",
                                     icon="warning")
         if result:
-            messagebox.showinfo("Emergency Stop", "Emergency stop sent to all robots!")
+            self._toast("Emergency stop sent to all robots!", 'danger')
 
 
 class GameStatePanel(ModernFrame):
@@ -541,53 +654,95 @@ class GameStatePanel(ModernFrame):
         self.info_frame.grid_columnconfigure(0, weight=1, minsize=150)
         self.info_frame.grid_columnconfigure(1, weight=1, minsize=150)
         
+        # Last (text, fg) shown per item, to skip redundant Tk calls
+        self._last: Dict[str, Optional[Tuple[str, str]]] = {
+            'state': None, 'score': None, 'connected': None, 'possession': None}
+        
     def update_game_state(self, robots: Dict[int, RobotData]):
         """Update game state with colors"""
         if not robots:
             return
             
         connected_robots = [robot for robot in robots.values() if robot.is_connected]
+        
+        # Work out what to show first, then touch only the labels that changed
+        values = {}
         if connected_robots:
             sample_robot = connected_robots[0]
             
-            # Update state with color
+            # State with color
             state_color = COLORS['text_primary']
             if sample_robot.game_state in ['PLAYING', 'READY']:
                 state_color = COLORS['success']
             elif sample_robot.game_state in ['PENALIZED', 'FINISHED', 'SET']:
                 state_color = COLORS['danger']
             
-            self.info_items['state'].config(text=sample_robot.game_state, fg=state_color)
-            self.info_items['score'].config(text=str(sample_robot.score))
+            values['state'] = (sample_robot.game_state, state_color)
+            values['score'] = (str(sample_robot.score), COLORS['text_primary'])
         
-        # Update connection count
+        # Connection count
         connected_count = len(connected_robots)
         total_count = 3
         conn_color = COLORS['success'] if connected_count == total_count else COLORS['warning']
-        self.info_items['connected'].config(text=f"{connected_count}/{total_count}", fg=conn_color)
+        values['connected'] = (f"{connected_count}/{total_count}", conn_color)
         
         # Ball possession
         possession_robot = next((robot for robot in connected_robots if robot.has_possession), None)
         if possession_robot:
-            self.info_items['possession'].config(text=f"Robot {possession_robot.robot_id}", fg=COLORS['success'])
+            values['possession'] = (f"Robot {possession_robot.robot_id}", COLORS['success'])
         else:
-            self.info_items['possession'].config(text="None", fg=COLORS['text_muted'])
+            values['possession'] = ("None", COLORS['text_muted'])
+        
+        last = self._last
+        for key, value in values.items():
+            if last[key] != value:
+                text, fg = value
+                self.info_items[key].config(text=text, fg=fg)
+                last[key] = value
 
 
 class RoboCupDashboard:
     """Beautiful modern RoboCup dashboard"""
     
-    def __init__(self):
+    # Upper bound on full GUI refreshes, independent of the robot data rate
+    MAX_REDRAW_HZ = 30
+    # Bounds of the refresh loop's polling interval, in milliseconds
+    MIN_POLL_MS = 20
+    MAX_POLL_MS = 200
+    # Seconds between two packets of a robot (robots send at about 10 Hz)
+    EXPECTED_PACKET_PERIOD = 0.1
+    
+    def __init__(self, raster_field: bool = False, **core_options):
         self.root = tk.Tk()
         self.root.title("RoboCup Humanoid Robot Dashboard")
         self.root.geometry("1400x900")
         self.root.configure(bg=COLORS['bg_primary'])
         
-        # Initialize dashboard core
-        self.dashboard_core = DashboardCore()
-        self.dashboard_core.add_update_callback(self.on_robot_update)
+        # Draw robots into the field image instead of as canvas items
+        self.raster_field = raster_field
         
-        self.robot_frames: Dict[int, RobotStatusFrame] = {}
+        # Initialize dashboard core (other options are passed to DashboardCore)
+        self.dashboard_core = DashboardCore(**core_options)
+        self.dashboard_core.add_update_callback(self.on_robot_update)
+        self.dashboard_core.add_topology_callback(self.on_topology_change)
+        
+        # Robot updates arrive on the core's threads and are handed to the Tk
+        # thread through this queue; see on_robot_update. SimpleQueue has no
+        # task tracking or size bookkeeping, so put/get are single C calls.
+        self._update_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Latest data per robot received since the last refresh
+        self._pending_updates: Dict[int, RobotData] = {}
+        
+        # Set when robot data changed since the last refresh
+        self._dirty = True
+        self._last_draw = 0.0
+        # Arrival time of the latest robot update (written by the core's threads)
+        self._last_packet_ts = 0.0
+        # Set when a robot connected, disconnected or was removed
+        self._topology_changed = False
+        # Text last shown in the status bar, and second last shown by the clock
+        self._status_text = ""
+        self._clock_second = -1
         
         self.setup_modern_gui()
         self.start_dashboard()
@@ -632,21 +787,9 @@ class RoboCupDashboard:
                               fg=COLORS['text_primary'], bg=COLORS['bg_secondary'])
         robot_title.pack(pady=(8, 4))
         
-        # Scrollable robot panel
-        canvas = tk.Canvas(robot_container, bg=COLORS['bg_secondary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(robot_container, orient="vertical", command=canvas.yview)
-        self.robot_panel = ModernFrame(canvas, bg_color=COLORS['bg_secondary'])
-        
-        self.robot_panel.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.robot_panel, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # One row per robot
+        self.robot_table = RobotStatusTable(robot_container)
+        self.robot_table.pack(fill=tk.BOTH, expand=True, padx=4, pady=(0, 4))
         
         # Control panel
         self.control_panel = ControlPanel(left_panel, self.dashboard_core)
@@ -664,7 +807,7 @@ class RoboCupDashboard:
         field_container = ModernFrame(right_panel, bg_color=COLORS['bg_tertiary'])
         field_container.pack(padx=12, pady=(0, 12), fill=tk.BOTH, expand=True)
         
-        self.field_canvas = ModernFieldCanvas(field_container)
+        self.field_canvas = ModernFieldCanvas(field_container, raster=self.raster_field)
         self.field_canvas.pack(pady=8)
         
         # Modern status bar
@@ -685,45 +828,121 @@ class RoboCupDashboard:
         """Start the dashboard"""
         self.dashboard_core.start()
         self.status_bar.config(text="Dashboard running - Waiting for robots...")
-        self.update_gui()
+        self._maybe_redraw()
+        self._update_clock()
         
     def update_gui(self):
         """Update GUI with smooth animations"""
         try:
+            # Clear the flag before reading robots so a change in between is not lost
+            topology_changed = self._topology_changed
+            self._topology_changed = False
             robots = self.dashboard_core.get_robots()
             
-            # Update robot status frames
-            for robot_id, robot_data in robots.items():
-                if robot_id not in self.robot_frames:
-                    frame = RobotStatusFrame(self.robot_panel, robot_id)
-                    frame.pack(fill=tk.X, padx=4, pady=4)
-                    self.robot_frames[robot_id] = frame
-                    
-                self.robot_frames[robot_id].update_data(robot_data)
+            pending = self._pending_updates
+            self._pending_updates = {}
+            
+            # Update the table rows of robots that sent data, joined or left
+            robot_table = self.robot_table
+            for robot_id in pending:
+                robot_data = robots.get(robot_id)
+                if robot_data is not None:
+                    robot_table.update_robot(robot_id, robot_data)
+            if topology_changed:
+                robot_table.remove_missing(robots)
             
             # Update visualizations
             self.field_canvas.update_robots(robots)
             self.game_panel.update_game_state(robots)
-            self.control_panel.update_robot_list(robots)
+            if topology_changed:
+                self.control_panel.update_robot_list(robots)
             
-            # Update status
-            connected_count = len(self.dashboard_core.get_connected_robots())
+            # Update status (only configure the label when its text changes)
+            connected_count = sum(1 for robot in robots.values() if robot.is_connected)
             total_count = len(robots)
             status_icon = "🟢" if connected_count > 0 else "🔴"
-            self.status_bar.config(text=f"{status_icon} Dashboard running - {connected_count}/{total_count} robots connected")
-            
-            # Update time
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.time_label.config(text=current_time)
+            status_text = f"{status_icon} Dashboard running - {connected_count}/{total_count} robots connected"
+            if status_text != self._status_text:
+                self._status_text = status_text
+                self.status_bar.config(text=status_text)
             
         except Exception as e:
             print(f"GUI update error: {e}")
             
-        self.root.after(100, self.update_gui)
+    def _maybe_redraw(self):
+        """Refresh the GUI at most MAX_REDRAW_HZ times a second, and only when data changed
+        
+        The loop reschedules itself to match the robot data rate: polling
+        near the next expected packet while data flows, and only every
+        MAX_POLL_MS while no robot is sending.
+        """
+        self._drain_updates()
+        
+        now = time.monotonic()
+        min_interval = 1.0 / self.MAX_REDRAW_HZ
+        since_draw = now - self._last_draw
+        if self._dirty and since_draw >= min_interval:
+            self._dirty = False
+            self._last_draw = now
+            self.update_gui()
+            since_draw = 0.0
+            
+        if self._dirty:
+            # Changes are waiting on the rate cap; come back as soon as it allows
+            delay = (min_interval - since_draw) * 1000
+        elif not self._update_queue.empty():
+            # Updates arrived while redrawing; pick them up once Tk is idle
+            self.root.after_idle(self._maybe_redraw)
+            return
+        else:
+            # Wake up around the next expected packet, and back off while robots are quiet
+            period = self.EXPECTED_PACKET_PERIOD
+            since_packet = now - self._last_packet_ts
+            if since_packet > 2 * period:
+                delay = self.MAX_POLL_MS
+            else:
+                delay = (period - since_packet) * 1000
+        self.root.after(int(max(self.MIN_POLL_MS, min(self.MAX_POLL_MS, delay))), self._maybe_redraw)
+        
+    def _update_clock(self):
+        """Update the time display when the wall-clock second changes"""
+        now = time.time()
+        second = int(now)
+        if second != self._clock_second:
+            self._clock_second = second
+            self.time_label.config(text=time.strftime("%H:%M:%S", time.localtime(second)))
+        # Wake just after the next second boundary so the display neither lags nor skips
+        self.root.after(int((second + 1 - now) * 1000) + 1, self._update_clock)
+        
+    def _drain_updates(self):
+        """Pull queued robot updates on the Tk thread, keeping only the latest per robot"""
+        latest = self._pending_updates
+        get_nowait = self._update_queue.get_nowait
+        while True:
+            try:
+                robot_id, robot_data = get_nowait()
+            except queue.Empty:
+                break
+            latest[robot_id] = robot_data
+        if latest or self._topology_changed:
+            self._dirty = True
         
     def on_robot_update(self, robot_id: int, robot_data: RobotData):
-        """Callback for robot updates"""
-        pass
+        """Callback for robot updates (also fired on disconnects)
+        
+        Runs on the dashboard core's worker threads. Tk is not thread-safe,
+        so this must never touch a widget; it only enqueues the update for
+        the Tk thread to pick up in _maybe_redraw.
+        """
+        self._update_queue.put_nowait((robot_id, robot_data))
+        self._last_packet_ts = time.monotonic()
+        
+    def on_topology_change(self, robots):
+        """Callback for robots connecting, disconnecting or being removed
+        
+        Also runs on the core's threads; it only raises a flag for the next refresh.
+        """
+        self._topology_changed = True
         
     def run(self):
         """Run the beautiful dashboard"""
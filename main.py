@@ -17,12 +17,14 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from dashboard_core import setup_logging
 from dashboard_gui import RoboCupDashboard
 
 
@@ -36,8 +38,18 @@ def main():
                        help='Start with simulated robot data for testing')
     parser.add_argument('--timeout', type=int, default=5,
                        help='Robot timeout in seconds (default: 5)')
+    parser.add_argument('--rx-cpu', type=int, default=None,
+                       help='Pin the UDP receive thread to this CPU (Linux only)')
+    parser.add_argument('--rx-nice', type=int, default=0,
+                       help='Niceness increment for the UDP receive thread, e.g. -5 (needs privileges)')
+    parser.add_argument('--raster-field', action='store_true',
+                       help='Draw robots into the field image instead of as canvas items')
+    parser.add_argument('--log-level', default='INFO',
+                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help='Dashboard log level (default: INFO)')
     
     args = parser.parse_args()
+    log_listener = setup_logging(getattr(logging, args.log_level))
     
     print("=" * 60)
     print("RoboCup Humanoid Robot Dashboard")
@@ -49,12 +61,13 @@ def main():
         print("WARNING: Running in simulation mode with fake robot data")
         print("This is for development and testing only!")
         
-        # Start robot simulator in a separate process
+        # Start robot simulator with its own event loop in a background thread
+        import asyncio
         import threading
         from robot_simulator import RobotSimulator
         
         simulator = RobotSimulator(port=args.port)
-        sim_thread = threading.Thread(target=simulator.run, daemon=True)
+        sim_thread = threading.Thread(target=asyncio.run, args=(simulator.run(),), daemon=True)
         sim_thread.start()
         print("Robot simulator started")
     
@@ -72,9 +85,9 @@ def main():
     
     try:
         # Create and run dashboard
-        dashboard = RoboCupDashboard()
-        dashboard.dashboard_core.port = args.port
-        dashboard.dashboard_core.timeout_seconds = args.timeout
+        dashboard = RoboCupDashboard(raster_field=args.raster_field,
+                                     port=args.port, timeout_seconds=args.timeout,
+                                     receive_cpu=args.rx_cpu, receive_nice=args.rx_nice)
         dashboard.run()
         
     except KeyboardInterrupt:
@@ -85,6 +98,7 @@ def main():
         traceback.print_exc()
     finally:
         print("Dashboard stopped")
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -7,27 +7,122 @@ for development and testing purposes. It generates realistic robot
 behavior including movement, ball detection, and game state changes.
 """
 
+import asyncio
 import json
 import socket
-import threading
 import time
 import math
 import random
-from typing import List, Dict, Any
+from typing import List, Optional
+
+import numpy as np
+
+from dashboard_core import (BINARY_DECISIONS, BINARY_GAME_STATES, BINARY_PACKET,
+                            BINARY_PACKET_TAG, BINARY_ROLES)
+from udp_batch import BatchSender, pack_frames
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# JSON packet layout sent by each robot. The %(name)s fields are fixed per
+# robot (and game state); the positional fields are filled in on every tick
+# by generate_data.
+_PACKET_TEMPLATE = (
+    '{"robot_id":%(robot_id)d,"robot_name":%(robot_name)s,"team_id":%(team_id)d,'
+    '"timestamp":%%.6f,'
+    '"game":{"state":%(state)s,"kickoff_side":%(kickoff_side)s,"score":%%d},'
+    '"robot":{"pose":{"x":%%.6f,"y":%%.6f,"theta":%%.6f},'
+    '"ball":{"detected":%%s,"x":%%.6f,"y":%%.6f,"range":%%.6f}},'
+    '"collaboration":{"role":%%s,"dynamic_role":%%d,"has_possession":%%s,'
+    '"possession_player":%%d,"ball_cost":%%.6f},'
+    '"behavior":{"decision":%%s,"ball_location_known":%%s},'
+    '"performance":{"avg_loop_time":%%.6f,"max_loop_time":%%.6f},'
+    '"head":{"pitch":%%.6f,"yaw":%%.6f},'
+    '"recovery":{"state":%%d,"available":%%s},'
+    '"team_count":%(team_count)d}'
+)
+
+# JSON literals indexed by a bool
+_JSON_BOOLS = (b'false', b'true')
+
+# Index of each game state, role and decision in the binary packet's tables
+_BINARY_CODES = {name: code for table in (BINARY_GAME_STATES, BINARY_ROLES, BINARY_DECISIONS)
+                 for code, name in enumerate(table)}
+
+
+def _step_movement(pose_x, pose_y, pose_theta, target_x, target_y, movement_speed,
+                   heading_noise, ball_x, ball_y, dt, ball_distances_sq):
+    """Move every robot towards its target in place and compute its squared distance to the ball
+    
+    Written as a plain loop over the parallel arrays so numba can compile it.
+    """
+    for i in range(pose_x.shape[0]):
+        dx = target_x[i] - pose_x[i]
+        dy = target_y[i] - pose_y[i]
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > 0.01:
+            distance = math.sqrt(distance_sq)
+            move = min(movement_speed[i] * dt, distance) / distance
+            pose_x[i] += dx * move
+            pose_y[i] += dy * move
+            # Face the movement direction
+            pose_theta[i] = math.atan2(dy, dx) + heading_noise[i]
+        
+        # Keep robots on field
+        pose_x[i] = min(max(pose_x[i], -4.5), 4.5)
+        pose_y[i] = min(max(pose_y[i], -3.0), 3.0)
+        
+        bx = ball_x - pose_x[i]
+        by = ball_y - pose_y[i]
+        ball_distances_sq[i] = bx * bx + by * by
+
+
+# Machine-code version of _step_movement when numba is installed; without it the
+# simulator steps the arrays with vectorized NumPy instead
+_step_movement_jit = njit(cache=True)(_step_movement) if njit is not None else None
 
 
 class SimulatedRobot:
     """Simulates a single robot's behavior and data transmission"""
     
-    def __init__(self, robot_id: int, team_id: int = 1):
+    # Fixed attribute set: no per-instance __dict__, and faster attribute access
+    # in the per-tick update and packet generation
+    __slots__ = (
+        'robot_id', 'team_id', 'robot_name',
+        'pose_x', 'pose_y', 'pose_theta',
+        'target_x', 'target_y', 'movement_speed',
+        'game_states', 'current_game_state_idx', 'score',
+        'ball_detected', 'ball_x', 'ball_y', 'ball_range',
+        'roles', 'current_role', 'dynamic_role', 'has_possession', 'ball_cost',
+        'decisions', '_n_decisions', 'current_decision',
+        'avg_loop_time', 'max_loop_time',
+        'head_pitch', 'head_yaw',
+        'recovery_state', 'recovery_available',
+        'last_update', 'last_target_change', 'last_game_state_change',
+        '_rng', '_uniform', '_random', '_choice', '_sqrt', '_atan2',
+        '_templates', '_json_strings', '_name_bytes',
+    )
+    
+    def __init__(self, robot_id: int, team_id: int = 1, seed: Optional[int] = None):
         self.robot_id = robot_id
         self.team_id = team_id
         self.robot_name = f"robot{robot_id + 1}"
         
+        # Private generator: no lock shared with other robots, and a given seed
+        # reproduces the same run. Its methods are bound once since
+        # update_simulation calls them a dozen times a tick.
+        self._rng = random.Random(None if seed is None else seed + robot_id)
+        self._uniform = uniform = self._rng.uniform
+        self._random = self._rng.random
+        self._choice = choice = self._rng.choice
+        
         # Robot state
-        self.pose_x = random.uniform(-3.0, 3.0)
-        self.pose_y = random.uniform(-2.0, 2.0)
-        self.pose_theta = random.uniform(0, 2 * math.pi)
+        self.pose_x = uniform(-3.0, 3.0)
+        self.pose_y = uniform(-2.0, 2.0)
+        self.pose_theta = uniform(0, 2 * math.pi)
         
         # Movement parameters
         self.target_x = self.pose_x
@@ -35,7 +130,7 @@ class SimulatedRobot:
         self.movement_speed = 0.5  # m/s
         
         # Game state
-        self.game_states = ["INITIAL", "READY", "SET", "PLAY", "END"]
+        self.game_states = ("INITIAL", "READY", "SET", "PLAY", "END")
         self.current_game_state_idx = 0
         self.score = 0
         
@@ -46,23 +141,24 @@ class SimulatedRobot:
         self.ball_range = 0.0
         
         # Collaboration
-        self.roles = ["master", "slave", "striker", "goalkeeper", "follower"]
-        self.current_role = random.choice(self.roles[:2])  # Start with master/slave
+        self.roles = ("master", "slave", "striker", "goalkeeper", "follower")
+        self.current_role = choice(self.roles[:2])  # Start with master/slave
         self.dynamic_role = robot_id  # 0=goalkeeper, 1=striker, 2=follower
         self.has_possession = False
-        self.ball_cost = random.uniform(0.5, 5.0)
+        self.ball_cost = uniform(0.5, 5.0)
         
         # Behavior
-        self.decisions = ["search_ball", "approach_ball", "kick_ball", "defend_goal", "position"]
-        self.current_decision = random.choice(self.decisions)
+        self.decisions = ("search_ball", "approach_ball", "kick_ball", "defend_goal", "position")
+        self._n_decisions = len(self.decisions)
+        self.current_decision = choice(self.decisions)
         
         # Performance
-        self.avg_loop_time = random.uniform(0.008, 0.025)  # 8-25ms
-        self.max_loop_time = self.avg_loop_time * random.uniform(1.5, 3.0)
+        self.avg_loop_time = uniform(0.008, 0.025)  # 8-25ms
+        self.max_loop_time = self.avg_loop_time * uniform(1.5, 3.0)
         
         # Head tracking
-        self.head_pitch = random.uniform(-0.5, 0.5)
-        self.head_yaw = random.uniform(-1.0, 1.0)
+        self.head_pitch = uniform(-0.5, 0.5)
+        self.head_yaw = uniform(-1.0, 1.0)
         
         # Recovery
         self.recovery_state = 0
@@ -73,162 +169,219 @@ class SimulatedRobot:
         self.last_target_change = time.time()
         self.last_game_state_change = time.time()
         
+        # Math functions bound once for update_simulation
+        self._sqrt = math.sqrt
+        self._atan2 = math.atan2
+        
+        # Packet templates with this robot's fixed identity filled in, one per
+        # game state (indexed like game_states), and the JSON encoding of every
+        # other string value it can send
+        identity = {
+            'robot_id': robot_id,
+            'robot_name': json.dumps(self.robot_name).replace('%', '%%'),
+            'team_id': team_id,
+            'kickoff_side': 'true' if robot_id == 0 else 'false',  # Robot 0 gets kickoff
+            'team_count': 2,  # Number of teammates (excluding self)
+        }
+        self._templates = tuple(
+            (_PACKET_TEMPLATE % dict(identity, state=json.dumps(state).replace('%', '%%'))).encode('utf-8')
+            for state in self.game_states)
+        self._json_strings = {name: json.dumps(name).encode('utf-8')
+                              for name in self.roles + self.decisions}
+        self._name_bytes = self.robot_name.encode('utf-8')[:32]
+        
     def update_simulation(self, dt: float, ball_pos: tuple = None):
-        """Update robot simulation state"""
+        """Update robot simulation state
+        
+        RobotSimulator moves all its robots at once with NumPy instead and
+        only calls update_sensors/update_behavior per robot.
+        """
         current_time = time.time()
         
+        self.update_movement(dt, current_time)
+        
+        # Update ball detection
+        if ball_pos:
+            bx = ball_pos[0] - self.pose_x
+            by = ball_pos[1] - self.pose_y
+            self.update_sensors(ball_pos, bx*bx + by*by)
+        
+        self.update_behavior(current_time)
+        
+    def update_movement(self, dt: float, current_time: float):
+        """Move towards the current target, picking a new one occasionally"""
+        uniform = self._uniform
+        sqrt = self._sqrt
+        atan2 = self._atan2
+        
         # Update movement towards target
         dx = self.target_x - self.pose_x
         dy = self.target_y - self.pose_y
-        distance_to_target = math.sqrt(dx*dx + dy*dy)
+        distance_sq = dx*dx + dy*dy
         
-        if distance_to_target > 0.1:  # Move towards target
+        if distance_sq > 0.01:  # Move towards target (more than 0.1 m away)
+            distance_to_target = sqrt(distance_sq)
             move_distance = min(self.movement_speed * dt, distance_to_target)
             self.pose_x += (dx / distance_to_target) * move_distance
             self.pose_y += (dy / distance_to_target) * move_distance
             
             # Update orientation to face movement direction
-            self.pose_theta = math.atan2(dy, dx) + random.uniform(-0.1, 0.1)
+            self.pose_theta = atan2(dy, dx) + uniform(-0.1, 0.1)
         
         # Change target occasionally
-        if current_time - self.last_target_change > random.uniform(3.0, 8.0):
-            self.target_x = random.uniform(-4.0, 4.0)
-            self.target_y = random.uniform(-2.5, 2.5)
+        if current_time - self.last_target_change > uniform(3.0, 8.0):
+            self.target_x = uniform(-4.0, 4.0)
+            self.target_y = uniform(-2.5, 2.5)
             self.last_target_change = current_time
             
-        # Update ball detection
-        if ball_pos:
-            ball_x, ball_y = ball_pos
-            distance_to_ball = math.sqrt((ball_x - self.pose_x)**2 + (ball_y - self.pose_y)**2)
+        # Keep robot on field
+        self.pose_x = max(-4.5, min(4.5, self.pose_x))
+        self.pose_y = max(-3.0, min(3.0, self.pose_y))
+        
+    def update_sensors(self, ball_pos: tuple, distance_sq_to_ball: float):
+        """Update ball detection, possession and head tracking for the current pose
+        
+        Takes the squared distance to the ball; the root is only taken once
+        the ball is detected and its range is reported.
+        """
+        uniform = self._uniform
+        rand = self._random
+        atan2 = self._atan2
+        ball_x, ball_y = ball_pos
+        
+        # Detect ball if within range (with some randomness)
+        detection_range = 3.0 + uniform(-0.5, 0.5)
+        self.ball_detected = distance_sq_to_ball < detection_range * detection_range
+        
+        if self.ball_detected:
+            distance_to_ball = self._sqrt(distance_sq_to_ball)
             
-            # Detect ball if within range (with some randomness)
-            detection_range = 3.0 + random.uniform(-0.5, 0.5)
-            self.ball_detected = distance_to_ball < detection_range
+            # Add some noise to ball position
+            self.ball_x = ball_x + uniform(-0.2, 0.2)
+            self.ball_y = ball_y + uniform(-0.2, 0.2)
+            self.ball_range = distance_to_ball + uniform(-0.1, 0.1)
             
-            if self.ball_detected:
-                # Add some noise to ball position
-                self.ball_x = ball_x + random.uniform(-0.2, 0.2)
-                self.ball_y = ball_y + random.uniform(-0.2, 0.2)
-                self.ball_range = distance_to_ball + random.uniform(-0.1, 0.1)
-                
-                # Possession logic
-                self.has_possession = distance_to_ball < 0.5 and random.random() < 0.3
-                
-                # Update ball cost based on distance
-                self.ball_cost = distance_to_ball + random.uniform(0.1, 0.5)
-                
-                # Head tracking towards ball
-                angle_to_ball = math.atan2(ball_y - self.pose_y, ball_x - self.pose_x)
-                self.head_yaw = angle_to_ball - self.pose_theta + random.uniform(-0.1, 0.1)
-                self.head_pitch = random.uniform(-0.2, 0.2)
-            else:
-                self.has_possession = False
-                # Random head movement when not tracking ball
-                self.head_yaw = random.uniform(-1.0, 1.0)
-                self.head_pitch = random.uniform(-0.3, 0.3)
+            # Possession logic
+            self.has_possession = distance_to_ball < 0.5 and rand() < 0.3
+            
+            # Update ball cost based on distance
+            self.ball_cost = distance_to_ball + uniform(0.1, 0.5)
+            
+            # Head tracking towards ball
+            angle_to_ball = atan2(ball_y - self.pose_y, ball_x - self.pose_x)
+            self.head_yaw = angle_to_ball - self.pose_theta + uniform(-0.1, 0.1)
+            self.head_pitch = uniform(-0.2, 0.2)
+        else:
+            self.has_possession = False
+            # Random head movement when not tracking ball
+            self.head_yaw = uniform(-1.0, 1.0)
+            self.head_pitch = uniform(-0.3, 0.3)
+        
+    def update_behavior(self, current_time: float):
+        """Update game state, decision and performance metrics"""
+        uniform = self._uniform
+        rand = self._random
         
         # Update game state occasionally
-        if current_time - self.last_game_state_change > random.uniform(10.0, 30.0):
+        if current_time - self.last_game_state_change > uniform(10.0, 30.0):
             self.current_game_state_idx = (self.current_game_state_idx + 1) % len(self.game_states)
             self.last_game_state_change = current_time
             
             # Increment score occasionally
-            if random.random() < 0.1:
+            if rand() < 0.1:
                 self.score += 1
         
         # Update behavior decision
-        if random.random() < 0.1:  # 10% chance to change decision each update
-            self.current_decision = random.choice(self.decisions)
+        if rand() < 0.1:  # 10% chance to change decision each update
+            self.current_decision = self.decisions[int(rand() * self._n_decisions)]
         
         # Update performance metrics with some variation
-        self.avg_loop_time = 0.015 + random.uniform(-0.005, 0.010)
-        self.max_loop_time = self.avg_loop_time * random.uniform(1.2, 2.5)
+        self.avg_loop_time = 0.015 + uniform(-0.005, 0.010)
+        self.max_loop_time = self.avg_loop_time * uniform(1.2, 2.5)
         
-        # Keep robot on field
-        self.pose_x = max(-4.5, min(4.5, self.pose_x))
-        self.pose_y = max(-3.0, min(3.0, self.pose_y))
+    def generate_data(self) -> bytes:
+        """Generate a JSON robot packet in the format expected by the dashboard"""
+        ball_detected = self.ball_detected
+        has_possession = self.has_possession
+        strings = self._json_strings
+        return self._templates[self.current_game_state_idx] % (
+            time.time(), self.score,
+            self.pose_x, self.pose_y, self.pose_theta,
+            _JSON_BOOLS[ball_detected],
+            self.ball_x if ball_detected else 0.0,
+            self.ball_y if ball_detected else 0.0,
+            self.ball_range if ball_detected else 0.0,
+            strings[self.current_role], self.dynamic_role, _JSON_BOOLS[has_possession],
+            self.robot_id if has_possession else -1, self.ball_cost,
+            strings[self.current_decision], _JSON_BOOLS[ball_detected],
+            self.avg_loop_time, self.max_loop_time,
+            self.head_pitch, self.head_yaw,
+            self.recovery_state, _JSON_BOOLS[self.recovery_available],
+        )
         
-    def generate_data(self) -> Dict[str, Any]:
-        """Generate robot data in the format expected by the dashboard"""
-        return {
-            "robot_id": self.robot_id,
-            "robot_name": self.robot_name,
-            "team_id": self.team_id,
-            "timestamp": time.time(),
-            
-            "game": {
-                "state": self.game_states[self.current_game_state_idx],
-                "kickoff_side": self.robot_id == 0,  # Robot 0 gets kickoff
-                "score": self.score
-            },
-            
-            "robot": {
-                "pose": {
-                    "x": self.pose_x,
-                    "y": self.pose_y,
-                    "theta": self.pose_theta
-                },
-                "ball": {
-                    "detected": self.ball_detected,
-                    "x": self.ball_x if self.ball_detected else 0.0,
-                    "y": self.ball_y if self.ball_detected else 0.0,
-                    "range": self.ball_range if self.ball_detected else 0.0
-                }
-            },
-            
-            "collaboration": {
-                "role": self.current_role,
-                "dynamic_role": self.dynamic_role,
-                "has_possession": self.has_possession,
-                "possession_player": self.robot_id if self.has_possession else -1,
-                "ball_cost": self.ball_cost
-            },
-            
-            "behavior": {
-                "decision": self.current_decision,
-                "ball_location_known": self.ball_detected
-            },
-            
-            "performance": {
-                "avg_loop_time": self.avg_loop_time,
-                "max_loop_time": self.max_loop_time
-            },
-            
-            "head": {
-                "pitch": self.head_pitch,
-                "yaw": self.head_yaw
-            },
-            
-            "recovery": {
-                "state": self.recovery_state,
-                "available": self.recovery_available
-            },
-            
-            "team_count": 2  # Number of teammates (excluding self)
-        }
+    def generate_binary_data(self) -> bytes:
+        """Generate the same robot packet in the dashboard's fixed binary layout (BINARY_PACKET)"""
+        ball_detected = self.ball_detected
+        has_possession = self.has_possession
+        return BINARY_PACKET.pack(
+            BINARY_PACKET_TAG, self.robot_id, self._name_bytes, self.team_id, time.time(),
+            _BINARY_CODES[self.game_states[self.current_game_state_idx]], self.robot_id == 0, self.score,
+            self.pose_x, self.pose_y, self.pose_theta,
+            ball_detected,
+            self.ball_x if ball_detected else 0.0,
+            self.ball_y if ball_detected else 0.0,
+            self.ball_range if ball_detected else 0.0,
+            _BINARY_CODES[self.current_role], self.dynamic_role, has_possession,
+            self.robot_id if has_possession else -1, self.ball_cost,
+            _BINARY_CODES[self.current_decision], ball_detected,
+            self.avg_loop_time, self.max_loop_time,
+            self.head_pitch, self.head_yaw,
+            self.recovery_state, self.recovery_available,
+            2,  # Number of teammates (excluding self)
+        )
 
 
 class RobotSimulator:
     """Simulates multiple robots for dashboard testing"""
     
+    # Seconds between two updates sent by each robot
+    TICK_INTERVAL = 0.1
+    # Kernel send buffer; lets a burst of ticks queue up instead of failing with EAGAIN
+    SEND_BUFFER_SIZE = 1 << 20
+    
     def __init__(self, num_robots: int = 3, team_id: int = 1, 
-                 target_ip: str = "127.0.0.1", port: int = 8080):
+                 target_ip: str = "127.0.0.1", port: int = 8080, seed: Optional[int] = None,
+                 binary: bool = False):
         self.num_robots = num_robots
         self.team_id = team_id
         self.target_ip = target_ip
         self.port = port
+        # Send the compact binary packet layout instead of JSON
+        self.binary = binary
         
         # Create simulated robots
         self.robots: List[SimulatedRobot] = []
         for i in range(num_robots):
-            robot = SimulatedRobot(i, team_id)
+            robot = SimulatedRobot(i, team_id, seed)
             self.robots.append(robot)
         
+        # Movement state of all robots as parallel arrays (one entry per robot),
+        # stepped together in update_all_robots
+        self._rng = np.random.default_rng(seed)
+        self.pose_x = np.array([robot.pose_x for robot in self.robots])
+        self.pose_y = np.array([robot.pose_y for robot in self.robots])
+        self.pose_theta = np.array([robot.pose_theta for robot in self.robots])
+        self.target_x = np.array([robot.target_x for robot in self.robots])
+        self.target_y = np.array([robot.target_y for robot in self.robots])
+        self.movement_speed = np.array([robot.movement_speed for robot in self.robots])
+        self.last_target_change = np.array([robot.last_target_change for robot in self.robots])
+        
         # Ball simulation
+        self._ball_rng = random.Random(seed)
         self.ball_x = 0.0
         self.ball_y = 0.0
-        self.ball_vx = random.uniform(-1.0, 1.0)
-        self.ball_vy = random.uniform(-1.0, 1.0)
+        self.ball_vx = self._ball_rng.uniform(-1.0, 1.0)
+        self.ball_vy = self._ball_rng.uniform(-1.0, 1.0)
         
         # Network
         self.socket = None
@@ -254,46 +407,129 @@ class RobotSimulator:
         self.ball_vy *= 0.99
         
         # Randomly kick ball
-        if random.random() < 0.01:  # 1% chance per update
-            self.ball_vx = random.uniform(-2.0, 2.0)
-            self.ball_vy = random.uniform(-2.0, 2.0)
+        rng = self._ball_rng
+        if rng.random() < 0.01:  # 1% chance per update
+            self.ball_vx = rng.uniform(-2.0, 2.0)
+            self.ball_vy = rng.uniform(-2.0, 2.0)
     
-    def run(self):
-        """Run the robot simulator"""
+    def update_all_robots(self, dt: float):
+        """Move all robots at once, then update their per-robot sensor and behavior state"""
+        current_time = time.time()
+        count = self.num_robots
+        uniform = self._rng.uniform
+        pose_x, pose_y = self.pose_x, self.pose_y
+        heading_noise = uniform(-0.1, 0.1, count)
+        
+        if _step_movement_jit is not None:
+            ball_distances_sq = np.empty(count)
+            _step_movement_jit(pose_x, pose_y, self.pose_theta, self.target_x, self.target_y,
+                               self.movement_speed, heading_noise, self.ball_x, self.ball_y,
+                               dt, ball_distances_sq)
+        else:
+            # Update movement towards targets
+            dx = self.target_x - pose_x
+            dy = self.target_y - pose_y
+            distance_to_target = np.hypot(dx, dy)
+            moving = distance_to_target > 0.1
+            # Fraction of the way to the target covered this tick (0 for robots that arrived)
+            step = np.minimum(self.movement_speed * dt, distance_to_target) / np.where(moving, distance_to_target, 1.0)
+            step[~moving] = 0.0
+            pose_x += dx * step
+            pose_y += dy * step
+            
+            # Face the movement direction
+            self.pose_theta = np.where(moving, np.arctan2(dy, dx) + heading_noise, self.pose_theta)
+            
+            # Keep robots on field
+            np.clip(pose_x, -4.5, 4.5, out=pose_x)
+            np.clip(pose_y, -3.0, 3.0, out=pose_y)
+            
+            bx = self.ball_x - pose_x
+            by = self.ball_y - pose_y
+            ball_distances_sq = bx * bx + by * by
+        
+        # Change targets occasionally
+        retarget = current_time - self.last_target_change > uniform(3.0, 8.0, count)
+        retarget_count = int(retarget.sum())
+        if retarget_count:
+            self.target_x[retarget] = uniform(-4.0, 4.0, retarget_count)
+            self.target_y[retarget] = uniform(-2.5, 2.5, retarget_count)
+            self.last_target_change[retarget] = current_time
+        
+        ball_pos = (self.ball_x, self.ball_y)
+        
+        for robot, x, y, theta, distance_sq in zip(self.robots, pose_x.tolist(), pose_y.tolist(),
+                                                   self.pose_theta.tolist(), ball_distances_sq.tolist()):
+            robot.pose_x = x
+            robot.pose_y = y
+            robot.pose_theta = theta
+            robot.update_sensors(ball_pos, distance_sq)
+            robot.update_behavior(current_time)
+    
+    async def run(self):
+        """Run the robot simulator (``asyncio.run(simulator.run())``)
+        
+        Ticks are scheduled against absolute monotonic deadlines, so time
+        spent simulating and sending does not make the send rate drift.
+        """
+        loop = asyncio.get_running_loop()
         try:
             # Create UDP socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Linux caps this at net.core.wmem_max
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+            # Non-blocking: a full send buffer must never stall the event loop
+            self.socket.setblocking(False)
             self.running = True
             
             print(f"Robot simulator sending data to {self.target_ip}:{self.port}")
             print(f"Simulating {self.num_robots} robots")
             
-            last_time = time.time()
+            # Fix the destination once so sends need no per-packet address, and
+            # send all robots' packets of a tick in one sendmmsg call where available
+            self.socket.connect((self.target_ip, self.port))
+            sender = BatchSender(self.socket)
+            
+            generators = [robot.generate_binary_data if self.binary else robot.generate_data
+                          for robot in self.robots]
+            
+            last_time = next_tick = loop.time()
             
             while self.running:
-                current_time = time.time()
+                current_time = loop.time()
                 dt = current_time - last_time
                 last_time = current_time
                 
                 # Update ball simulation
                 self.update_ball_simulation(dt)
                 
-                # Update each robot and send data
-                for robot in self.robots:
-                    robot.update_simulation(dt, (self.ball_x, self.ball_y))
-                    
-                    # Generate and send robot data
-                    data = robot.generate_data()
-                    json_data = json.dumps(data)
-                    
+                # Update all robots and generate their data
+                self.update_all_robots(dt)
+                # Pack as many robots' packets per datagram as fit below the MTU;
+                # a robot whose packet cannot be encoded only misses this tick
+                packets = []
+                for generate in generators:
                     try:
-                        self.socket.sendto(json_data.encode('utf-8'), 
-                                         (self.target_ip, self.port))
+                        packets.append(generate())
                     except Exception as e:
-                        print(f"Failed to send data for robot {robot.robot_id}: {e}")
+                        print(f"Failed to encode robot data: {e}")
+                packets = pack_frames(packets)
+                
+                try:
+                    sender.send_batch(packets)
+                except ConnectionRefusedError:
+                    pass  # Nothing listening (yet); connected UDP sockets report the ICMP error
+                except BlockingIOError:
+                    pass  # Send buffer full; drop the rest of this tick, the next one supersedes it
+                except Exception as e:
+                    print(f"Failed to send robot data: {e}")
                 
-                # Send updates at ~10 Hz
-                time.sleep(0.1)
+                # Send updates at 10 Hz; after a stall, skip the missed ticks
+                # instead of bursting to catch up
+                next_tick += self.TICK_INTERVAL
+                if next_tick < loop.time():
+                    next_tick = loop.time()
+                await asyncio.sleep(next_tick - loop.time())
                 
         except Exception as e:
             print(f"Simulator error: {e}")
@@ -315,16 +551,19 @@ if __name__ == "__main__":
     parser.add_argument('--robots', type=int, default=3, help='Number of robots to simulate')
     parser.add_argument('--port', type=int, default=8080, help='Target port')
     parser.add_argument('--ip', default='127.0.0.1', help='Target IP address')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible run')
+    parser.add_argument('--binary', action='store_true', help='Send compact binary packets instead of JSON')
     
     args = parser.parse_args()
     
-    simulator = RobotSimulator(num_robots=args.robots, target_ip=args.ip, port=args.port)
+    simulator = RobotSimulator(num_robots=args.robots, target_ip=args.ip, port=args.port,
+                               seed=args.seed, binary=args.binary)
     
     try:
         print(f"Starting robot simulator with {args.robots} robots")
         print(f"Sending data to {args.ip}:{args.port}")
         print("Press Ctrl+C to stop")
-        simulator.run()
+        asyncio.run(simulator.run())
     except KeyboardInterrupt:
         print("\nStopping simulator...")
         simulator.stop() 
\ No newline at end of file
@@ -0,0 +1,254 @@
+"""Tests for robot state tracking in dashboard_core"""
+
+import json
+import threading
+import time
+
+import pytest
+
+import dashboard_core
+from dashboard_core import (ROBOT_DATA_SCHEMA, DashboardCore, RobotData, SpscRing,
+                            compile_robot_parser, copy_schema_fields)
+from udp_batch import pack_frames
+
+ADDR = ('127.0.0.1', 9000)
+
+
+def make_packet(robot_id=1, timestamp=1.0, **sections):
+    """A complete robot packet; keyword arguments replace whole top-level entries"""
+    packet = {
+        'robot_id': robot_id,
+        'robot_name': f"robot{robot_id}",
+        'team_id': 1,
+        'timestamp': timestamp,
+        'game': {'state': "PLAY", 'kickoff_side': True, 'score': 2},
+        'robot': {
+            'pose': {'x': 1.5, 'y': -0.5, 'theta': 0.25},
+            'ball': {'detected': True, 'x': 0.5, 'y': 0.75, 'range': 1.25},
+        },
+        'collaboration': {'role': "striker", 'dynamic_role': 3, 'has_possession': True,
+                          'possession_player': robot_id, 'ball_cost': 0.4},
+        'behavior': {'decision': "kick_ball", 'ball_location_known': True},
+        'performance': {'avg_loop_time': 0.02, 'max_loop_time': 0.05},
+        'head': {'pitch': 0.1, 'yaw': -0.2},
+        'recovery': {'state': 1, 'available': True},
+        'team_count': 2,
+    }
+    packet.update(sections)
+    return packet
+
+
+def wait_for(condition, timeout=3.0):
+    """Poll until condition() is true, failing the test after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def running_core(monkeypatch):
+    """Start a DashboardCore on an ephemeral port with short expiry and removal times"""
+    cores = []
+
+    def start(timeout_seconds=0.2, removal_seconds=0.6):
+        monkeypatch.setattr(dashboard_core, 'ROBOT_REMOVAL_SECONDS', removal_seconds)
+        core = DashboardCore(port=0, timeout_seconds=timeout_seconds)
+        core.start()
+        assert core.running
+        cores.append(core)
+        return core
+
+    yield start
+    for core in cores:
+        core.stop()
+
+
+def test_robot_expires_and_is_removed(running_core):
+    core = running_core(timeout_seconds=0.2, removal_seconds=0.6)
+    disconnected_at = []
+    core.add_update_callback(
+        lambda robot_id, robot: None if robot.is_connected else disconnected_at.append(time.monotonic()))
+
+    start = time.monotonic()
+    core._process_robot_data(make_packet(), ADDR)
+    assert core.get_connected_robots().keys() == {1}
+
+    wait_for(lambda: 1 not in core.get_robots())
+    removed_at = time.monotonic()
+
+    assert len(disconnected_at) == 1
+    assert 0.2 <= disconnected_at[0] - start < 0.5
+    assert 0.6 <= removed_at - start < 1.0
+
+
+def test_robot_that_keeps_sending_stays_connected(running_core):
+    core = running_core(timeout_seconds=0.2)
+    for i in range(8):
+        core._process_robot_data(make_packet(timestamp=i + 1.0), ADDR)
+        time.sleep(0.05)
+    assert core.robots[1].is_connected
+
+
+def test_robot_connecting_after_others_disconnected_expires_on_time(running_core):
+    # The only pending heap entry is robot 1's removal, far beyond robot 2's timeout
+    core = running_core(timeout_seconds=0.2, removal_seconds=2.0)
+    core._process_robot_data(make_packet(robot_id=1), ADDR)
+    wait_for(lambda: not core.robots[1].is_connected)
+
+    start = time.monotonic()
+    core._process_robot_data(make_packet(robot_id=2), ADDR)
+    wait_for(lambda: not core.robots[2].is_connected, timeout=1.0)
+    assert time.monotonic() - start < 0.5
+
+
+def test_stop_wakes_the_cleanup_thread(running_core):
+    core = running_core(timeout_seconds=30.0, removal_seconds=60.0)
+    core._process_robot_data(make_packet(), ADDR)
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    core.stop()
+    assert not core.cleanup_thread.is_alive()
+    assert time.monotonic() - start < 1.0
+
+
+def test_repeated_sample_skips_callbacks():
+    core = DashboardCore(port=0)
+    updates = []
+    core.add_update_callback(lambda robot_id, robot: updates.append(robot.pose_x))
+
+    core._process_robot_data(make_packet(timestamp=5.0), ADDR)
+    last_update = core.robots[1].last_update
+    moved = make_packet(timestamp=5.0, robot={'pose': {'x': 3.0}})
+    core._process_robot_data(moved, ADDR)
+
+    # Kept alive, but the repeated sample is not applied
+    assert core.robots[1].last_update > last_update
+    assert updates == [1.5]
+
+    moved['timestamp'] = 5.1
+    core._process_robot_data(moved, ADDR)
+    assert updates == [1.5, 3.0]
+
+
+def test_packets_without_timestamp_are_never_skipped():
+    core = DashboardCore(port=0)
+    updates = []
+    core.add_update_callback(lambda robot_id, robot: updates.append(robot_id))
+
+    packet = make_packet()
+    del packet['timestamp']
+    core._process_robot_data(packet, ADDR)
+    core._process_robot_data(packet, ADDR)
+    assert updates == [1, 1]
+
+
+def schema_values(robot):
+    """The robot's attributes covered by ROBOT_DATA_SCHEMA"""
+    return {attr: getattr(robot, attr) for _, fields in ROBOT_DATA_SCHEMA for _, attr, _ in fields}
+
+
+def test_compiled_parser_matches_schema_copy():
+    packet = make_packet()
+    expected = RobotData()
+    copy_schema_fields(packet, expected)
+    robot = RobotData()
+    compile_robot_parser(packet)(packet, robot)
+    assert schema_values(robot) == schema_values(expected)
+
+    # Sections missing from the sample are read with their defaults
+    sparse = make_packet(robot={'pose': {'x': 2.0, 'y': 1.0, 'theta': 0.0}})
+    del sparse['head']
+    expected = RobotData()
+    copy_schema_fields(sparse, expected)
+    robot = RobotData()
+    compile_robot_parser(sparse)(sparse, robot)
+    assert schema_values(robot) == schema_values(expected)
+    assert robot.ball_detected is False
+
+
+def test_deviating_packet_falls_back_to_schema_copy():
+    core = DashboardCore(port=0)
+    core._process_robot_data(make_packet(timestamp=1.0), ADDR)
+
+    # Same sender, but without the sections its generated parser indexes directly
+    deviating = make_packet(timestamp=2.0)
+    del deviating['game']
+    deviating['robot'] = {'pose': {'x': -1.0}}
+    core._process_robot_data(deviating, ADDR)
+
+    robot = core.robots[1]
+    assert robot.timestamp == 2.0
+    assert robot.game_state == "UNKNOWN"
+    assert robot.pose_x == -1.0
+    assert robot.pose_y == 0.0
+    assert robot.ball_detected is False
+
+
+def test_parser_cache_is_bounded():
+    core = DashboardCore(port=0)
+    for version in range(dashboard_core.MAX_PARSERS + 5):
+        core._process_robot_data(make_packet(timestamp=version + 1.0, firmware_version=version), ADDR)
+    assert len(core._parsers) == dashboard_core.MAX_PARSERS
+    assert core.robots[1].timestamp == dashboard_core.MAX_PARSERS + 5.0
+
+    # Unhashable layout keys are parsed without caching
+    core._process_robot_data(make_packet(timestamp=100.0, firmware_version=[1, 2]), ADDR)
+    assert core.robots[1].timestamp == 100.0
+
+
+def test_ring_is_fifo_and_drops_when_full():
+    ring = SpscRing(3)
+    assert ring.get() is None
+    assert [ring.put(i) for i in range(4)] == [True, True, True, False]
+    assert ring.dropped == 1
+    assert len(ring) == 3
+
+    # Wraps around the end of the buffer
+    assert ring.get() == 0
+    assert ring.put(4)
+    assert [ring.get() for _ in range(4)] == [1, 2, 4, None]
+    assert len(ring) == 0
+
+
+def test_ring_hands_items_between_threads_in_order():
+    ring = SpscRing(16)
+    count = 10000
+    received = []
+
+    def consume():
+        while len(received) < count:
+            item = ring.get()
+            if item is None:
+                ring.wait(timeout=1.0)
+            else:
+                received.append(item)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(count):
+        while not ring.put(i):
+            ring.notify()
+            time.sleep(0)
+        ring.notify()
+    consumer.join(timeout=10.0)
+
+    assert received == list(range(count))
+
+
+def test_frame_updates_every_robot_in_it():
+    core = DashboardCore(port=0)
+    frame, = pack_frames([json.dumps(make_packet(robot_id=i)).encode() for i in (1, 2)])
+    core._handle_datagram(frame, ADDR)
+    assert sorted(core.get_robots()) == [1, 2]
+
+    # A cut-off frame is rejected as a whole
+    core._handle_datagram(pack_frames([json.dumps(make_packet(robot_id=4)).encode()])[0][:-1], ADDR)
+    assert 4 not in core.get_robots()
+
+
+def test_malformed_binary_packet_is_ignored():
+    core = DashboardCore(port=0)
+    core._handle_datagram(dashboard_core.BINARY_PACKET_TAG + b'\0' * 10, ADDR)
+    assert not core.get_robots()
@@ -0,0 +1,70 @@
+"""Tests for the simulated robots in robot_simulator"""
+
+import itertools
+import json
+
+import numpy as np
+import pytest
+
+import robot_simulator
+from dashboard_core import decode_binary_packet
+from robot_simulator import RobotSimulator, SimulatedRobot
+
+
+def run_simulation(monkeypatch, step, ticks=50):
+    """Positions of a seeded 20-robot simulation after ``ticks`` updates with the given movement step"""
+    monkeypatch.setattr(robot_simulator, '_step_movement_jit', step)
+    # A clock that only advances when read, so both runs retarget their robots on the same ticks
+    clock = itertools.count(1000.0, 0.05)
+    monkeypatch.setattr(robot_simulator.time, 'time', lambda: next(clock))
+    simulator = RobotSimulator(num_robots=20, seed=7)
+    for _ in range(ticks):
+        simulator.update_ball_simulation(0.1)
+        simulator.update_all_robots(0.1)
+    return np.array([[robot.pose_x, robot.pose_y, robot.pose_theta, robot.ball_range]
+                     for robot in simulator.robots])
+
+
+@pytest.mark.parametrize('step', [
+    pytest.param(robot_simulator._step_movement, id='python'),
+    pytest.param(robot_simulator._step_movement_jit, id='numba',
+                 marks=pytest.mark.skipif(robot_simulator._step_movement_jit is None,
+                                          reason="numba is not installed")),
+])
+def test_movement_kernel_matches_numpy(monkeypatch, step):
+    # The same seed must give the same run whichever movement step is used
+    expected = run_simulation(monkeypatch, None)
+    np.testing.assert_allclose(run_simulation(monkeypatch, step), expected, rtol=1e-9, atol=1e-12)
+
+
+def flatten(packet, prefix=''):
+    """Map each leaf of a nested packet dict to its dotted path"""
+    leaves = {}
+    for key, value in packet.items():
+        if isinstance(value, dict):
+            leaves.update(flatten(value, f"{prefix}{key}."))
+        else:
+            leaves[prefix + key] = value
+    return leaves
+
+
+@pytest.mark.parametrize('robot_id', [0, 5, 200])
+def test_binary_packet_matches_json_packet(robot_id):
+    robot = SimulatedRobot(robot_id, team_id=2, seed=3)
+    robot.update_simulation(0.1, (0.5, 0.5))
+    # Values beyond a signed byte must survive the fixed layout
+    robot.has_possession = True
+    robot.dynamic_role = 300
+    robot.recovery_state = 1000
+
+    expected = flatten(json.loads(robot.generate_data()))
+    decoded = flatten(decode_binary_packet(robot.generate_binary_data()))
+    assert decoded.keys() == expected.keys()
+    # Both stamp the packet with the current time
+    del expected['timestamp'], decoded['timestamp']
+    for path, value in expected.items():
+        if isinstance(value, float):
+            assert decoded[path] == pytest.approx(value, rel=1e-6, abs=1e-6), path
+        else:
+            assert decoded[path] == value, path
+    assert decoded['collaboration.possession_player'] == robot_id
@@ -0,0 +1,98 @@
+"""Tests for the batched UDP helpers in udp_batch"""
+
+import select
+import socket
+
+import pytest
+
+import udp_batch
+from udp_batch import BatchReceiver, BatchSender, is_frame, pack_frames, unpack_frame
+
+
+@pytest.fixture(params=['mmsg', 'fallback'])
+def loopback(request, monkeypatch):
+    """A non-blocking receiving socket and a sending socket on 127.0.0.1
+
+    Runs each test with recvmmsg/sendmmsg and again with the plain socket loop.
+    """
+    if request.param == 'fallback':
+        monkeypatch.setattr(udp_batch, '_recvmmsg', None)
+        monkeypatch.setattr(udp_batch, '_sendmmsg', None)
+    elif udp_batch._recvmmsg is None or udp_batch._sendmmsg is None:
+        pytest.skip("recvmmsg/sendmmsg not available on this platform")
+
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(('127.0.0.1', 0))
+    rx.setblocking(False)
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    yield rx, tx
+    rx.close()
+    tx.close()
+
+
+def receive(receiver, count, timeout=1.0):
+    """Collect batches until ``count`` datagrams arrived or nothing more comes in"""
+    packets = []
+    while len(packets) < count:
+        if not select.select([receiver.sock], [], [], timeout)[0]:
+            break
+        packets.extend(receiver.recv_batch())
+    return packets
+
+
+def test_batch_round_trip(loopback):
+    rx, tx = loopback
+    packets = [b'packet %d' % i * (i + 1) for i in range(10)]
+    BatchSender(tx, rx.getsockname()).send_batch(packets)
+
+    received = receive(BatchReceiver(rx, batch_size=4), len(packets))
+    assert [data for data, _ in received] == packets
+    assert {sender for _, sender in received} == {('127.0.0.1', tx.getsockname()[1])}
+
+
+def test_empty_batch_sends_nothing(loopback):
+    rx, tx = loopback
+    sender = BatchSender(tx, rx.getsockname())
+    sender.send_batch([])
+    sender.send_batch([b'after'])
+
+    received = receive(BatchReceiver(rx), 2, timeout=0.2)
+    assert [data for data, _ in received] == [b'after']
+
+
+def test_oversized_datagrams_are_dropped_and_counted(loopback):
+    rx, tx = loopback
+    BatchSender(tx, rx.getsockname()).send_batch([b'x' * 100, b'small', b'y' * 65])
+
+    receiver = BatchReceiver(rx, buffer_size=64)
+    received = receive(receiver, 3, timeout=0.2)
+    assert [data for data, _ in received] == [b'small']
+    assert receiver.truncated == 2
+
+
+def test_frames_round_trip():
+    packets = [b'{"robot_id":%d}' % i + b' ' * (i * 7) for i in range(40)]
+    frames = pack_frames(packets, max_size=400)
+
+    assert 1 < len(frames) < len(packets)
+    assert all(is_frame(frame) and len(frame) <= 400 for frame in frames)
+    assert [packet for frame in frames for packet in unpack_frame(frame)] == packets
+
+
+def test_oversized_packet_is_sent_unframed():
+    small = b'{"robot_id":1}'
+    large = b'{"robot_id":2,"pad":"' + b'x' * 500 + b'"}'
+    frames = pack_frames([small, large, small], max_size=400)
+
+    assert large in frames
+    assert not is_frame(large)
+    framed = [frame for frame in frames if frame is not large]
+    assert [packet for frame in framed for packet in unpack_frame(frame)] == [small, small]
+
+
+@pytest.mark.parametrize('cut', [1, 3])
+def test_truncated_frame_is_rejected(cut):
+    # Cutting 1 byte shortens the last record; cutting 3 leaves half its header
+    frame, = pack_frames([b'first', b'x'])
+    with pytest.raises(ValueError):
+        unpack_frame(frame[:-cut])
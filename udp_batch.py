@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Batched UDP I/O helpers
+
+Wraps the Linux recvmmsg(2) and sendmmsg(2) system calls with ctypes so the
+dashboard can pull several robot datagrams out of the kernel per system call,
+and the simulator can send all robots' packets of a tick in one. Platforms
+without them fall back to a short loop of recvfrom/sendto calls.
+
+pack_frames/unpack_frame additionally carry several packets in one datagram,
+each record prefixed with its length as a 4-byte big-endian integer.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import struct
+import sys
+from typing import List, Optional, Tuple
+
+# Upper bound on datagrams drained per wake-up when recvmmsg is unavailable
+FALLBACK_BATCH_SIZE = 32
+
+# Receive buffer size that fits any UDP payload
+MAX_DATAGRAM_SIZE = 65535
+
+# Largest framed datagram built by pack_frames; stays below a typical
+# Ethernet MTU so frames are never fragmented
+MAX_FRAME_SIZE = 1400
+
+# Length prefix of each record in a frame. Records are far smaller than
+# 16 MiB, so a frame always starts with a zero byte, which no JSON packet does.
+_FRAME_PREFIX = struct.Struct('!I')
+
+# With this flag Linux recvfrom returns a datagram's full length even if it was truncated
+_MSG_TRUNC = getattr(socket, 'MSG_TRUNC', 0) if sys.platform.startswith('linux') else 0
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IoVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _MsgHdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ('sin_family', ctypes.c_ushort),
+        ('sin_port', ctypes.c_uint16),
+        ('sin_addr', ctypes.c_ubyte * 4),
+        ('sin_zero', ctypes.c_ubyte * 8),
+    ]
+
+
+def _load_libc_function(name: str, argtypes: list):
+    """Return the named libc function, or None if the platform lacks it"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        func = getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+
+_recvmmsg = _load_libc_function('recvmmsg', [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                                             ctypes.c_int, ctypes.c_void_p])
+_sendmmsg = _load_libc_function('sendmmsg', [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                                             ctypes.c_int])
+
+
+class BatchReceiver:
+    """Receives up to ``batch_size`` datagrams from a non-blocking UDP socket per call
+
+    Datagrams larger than ``buffer_size`` are dropped and counted in ``truncated``
+    (where the platform reports truncation) instead of being returned cut short.
+    """
+
+    def __init__(self, sock: socket.socket, batch_size: int = 32,
+                 buffer_size: int = MAX_DATAGRAM_SIZE):
+        self.sock = sock
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        self.truncated = 0
+        self.use_recvmmsg = _recvmmsg is not None and sock.family == socket.AF_INET
+
+        if self.use_recvmmsg:
+            self._setup_mmsg()
+        else:
+            # Reused receive buffer for recvfrom_into
+            self._rx_buf = bytearray(buffer_size)
+            self._rx_view = memoryview(self._rx_buf)
+
+    def _setup_mmsg(self):
+        """Pre-allocate the mmsghdr array and its payload/address buffers once"""
+        n = self.batch_size
+        self._buffers = [bytearray(self.buffer_size) for _ in range(n)]
+        self._views = [memoryview(buf) for buf in self._buffers]
+        self._c_buffers = [(ctypes.c_char * self.buffer_size).from_buffer(buf)
+                           for buf in self._buffers]
+        self._iovecs = (_IoVec * n)()
+        self._addrs = (_SockAddrIn * n)()
+        self._msgs = (_MMsgHdr * n)()
+
+        for i in range(n):
+            self._iovecs[i].iov_base = ctypes.addressof(self._c_buffers[i])
+            self._iovecs[i].iov_len = self.buffer_size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._addrs[i])
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def recv_batch(self) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """Return all immediately available datagrams (at most one batch)"""
+        if self.use_recvmmsg:
+            return self._recv_mmsg()
+        return self._recv_loop()
+
+    def _recv_mmsg(self) -> List[Tuple[bytes, Tuple[str, int]]]:
+        msgs = self._msgs
+        addr_len = ctypes.sizeof(_SockAddrIn)
+        for i in range(self.batch_size):
+            # The kernel overwrites these on every call
+            msgs[i].msg_hdr.msg_namelen = addr_len
+            msgs[i].msg_hdr.msg_flags = 0
+
+        count = _recvmmsg(self.sock.fileno(), msgs, self.batch_size, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        packets = []
+        for i in range(count):
+            msg = msgs[i]
+            if msg.msg_hdr.msg_flags & socket.MSG_TRUNC:
+                self.truncated += 1
+                continue
+            addr = self._addrs[i]
+            sender = (socket.inet_ntoa(bytes(addr.sin_addr)), socket.ntohs(addr.sin_port))
+            packets.append((bytes(self._views[i][:msg.msg_len]), sender))
+        return packets
+
+    def _recv_loop(self) -> List[Tuple[bytes, Tuple[str, int]]]:
+        packets = []
+        recvfrom_into = self.sock.recvfrom_into
+        rx_buf = self._rx_buf
+        rx_view = self._rx_view
+        for _ in range(min(self.batch_size, FALLBACK_BATCH_SIZE)):
+            try:
+                nbytes, sender = recvfrom_into(rx_buf, 0, _MSG_TRUNC)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                # Windows reports an oversized datagram as WSAEMSGSIZE
+                if e.errno in (errno.EMSGSIZE, 10040):
+                    self.truncated += 1
+                    continue
+                raise
+            if nbytes > self.buffer_size:
+                self.truncated += 1
+                continue
+            # Copy exactly the payload out; the buffer is reused for the next datagram
+            packets.append((bytes(rx_view[:nbytes]), sender))
+        return packets
+
+
+class BatchSender:
+    """Sends a list of datagrams to one fixed destination, one sendmmsg call per batch
+
+    Pass ``addr=None`` for a socket that is already connect()ed to its
+    destination; the kernel then needs no address per datagram.
+    """
+
+    def __init__(self, sock: socket.socket, addr: Optional[Tuple[str, int]] = None):
+        self.sock = sock
+        self.addr = addr
+        self.use_sendmmsg = _sendmmsg is not None and sock.family == socket.AF_INET
+        self._capacity = 0
+
+        if self.use_sendmmsg and addr is not None:
+            # The destination never changes, so its sockaddr_in is built once
+            self._dest = _SockAddrIn()
+            self._dest.sin_family = socket.AF_INET
+            self._dest.sin_port = socket.htons(addr[1])
+            self._dest.sin_addr[:] = socket.inet_aton(socket.gethostbyname(addr[0]))
+
+    def _grow(self, count: int):
+        """(Re)allocate the mmsghdr and iovec arrays for ``count`` messages"""
+        self._iovecs = (_IoVec * count)()
+        self._msgs = (_MMsgHdr * count)()
+        connected = self.addr is None
+        dest = None if connected else ctypes.addressof(self._dest)
+        for i in range(count):
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = dest
+            hdr.msg_namelen = 0 if connected else ctypes.sizeof(_SockAddrIn)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+        self._capacity = count
+
+    def send_batch(self, packets: List[bytes]) -> None:
+        """Send every packet in ``packets`` as its own datagram"""
+        if not packets:
+            return
+        if not self.use_sendmmsg:
+            if self.addr is None:
+                send = self.sock.send
+                for packet in packets:
+                    send(packet)
+            else:
+                sendto = self.sock.sendto
+                addr = self.addr
+                for packet in packets:
+                    sendto(packet, addr)
+            return
+
+        count = len(packets)
+        if count > self._capacity:
+            self._grow(count)
+        iovecs = self._iovecs
+        # Point the iovecs straight at the bytes objects; `buffers` keeps them alive
+        buffers = [ctypes.c_char_p(packet) for packet in packets]
+        for i, (packet, buf) in enumerate(zip(packets, buffers)):
+            iovecs[i].iov_base = ctypes.cast(buf, ctypes.c_void_p)
+            iovecs[i].iov_len = len(packet)
+
+        fd = self.sock.fileno()
+        sent = 0
+        while sent < count:
+            result = _sendmmsg(fd, ctypes.byref(self._msgs[sent]), count - sent, 0)
+            if result < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                raise OSError(err, os.strerror(err))
+            sent += result
+
+
+def is_frame(data: bytes) -> bool:
+    """Return whether a datagram was built by pack_frames rather than being a single packet"""
+    return data[:1] == b'\x00'
+
+
+def pack_frames(packets: List[bytes], max_size: int = MAX_FRAME_SIZE) -> List[bytes]:
+    """Group packets into as few length-prefixed frames of at most ``max_size`` bytes as possible
+
+    A packet too large to share a frame is returned unframed, as its own datagram.
+    """
+    pack = _FRAME_PREFIX.pack
+    header_size = _FRAME_PREFIX.size
+    datagrams = []
+    parts: List[bytes] = []
+    size = 0
+    for packet in packets:
+        record_size = header_size + len(packet)
+        if record_size > max_size:
+            datagrams.append(packet)
+            continue
+        if size + record_size > max_size:
+            datagrams.append(b''.join(parts))
+            parts = []
+            size = 0
+        parts.append(pack(len(packet)))
+        parts.append(packet)
+        size += record_size
+    if parts:
+        datagrams.append(b''.join(parts))
+    return datagrams
+
+
+def unpack_frame(data: bytes) -> List[bytes]:
+    """Split a frame built by pack_frames back into its packets
+
+    Raises ValueError if a record runs past the end of the datagram.
+    """
+    unpack_from = _FRAME_PREFIX.unpack_from
+    header_size = _FRAME_PREFIX.size
+    packets = []
+    offset = 0
+    end = len(data)
+    while offset < end:
+        if offset + header_size > end:
+            raise ValueError(f"truncated record header at byte {offset}")
+        (length,) = unpack_from(data, offset)
+        offset += header_size
+        if offset + length > end:
+            raise ValueError(f"record of {length} bytes at byte {offset} exceeds the datagram")
+        packets.append(data[offset:offset + length])
+        offset += length
+    return packets